@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Agent Memory Engine
+Append-only, per-agent event log with hot/warm/cold tiers by recency
+
+Tiers follow the documented thresholds: the newest 20 events are hot, events 21-100
+are warm and everything older is cold. Tiers are derived from an event's rank, so
+entries move down a tier automatically as newer events are appended.
+
+Layout under the memory directory (default .claude/memory):
+    <agent>/events.jsonl                    active log: one JSON event per line, with "seq"
+    <agent>/.lock                           flock target for appends and compaction
+    <agent>/cold/cold-<first>-<last>.jsonl  compacted cold segments (seq ranges)
+
+Appends are one locked write to the end of the active log. Hot and warm reads scan the
+log backwards from its end, so they cost the same whatever the history size.
+Compaction moves events beyond the warm tier into a cold segment once the active log
+grows past `compact_bytes`.
+
+Usage (from the project root):
+    python .claude/scripts/agent_memory.py stats <agent>
+"""
+
+import os
+import sys
+import json
+import argparse
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not locked across processes
+    fcntl = None
+
+HOT_LIMIT = 20
+WARM_LIMIT = 100
+COMPACT_BYTES = 1024 * 1024
+MEMORY_DIR = Path('.claude/memory')
+
+def read_tail(path: Path, count: int, block_size: int = 64 * 1024) -> List[bytes]:
+    """Last `count` lines of a file (oldest first), reading backwards block by block"""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+    with f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        # One extra newline: the block may start mid-line
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+        # The first piece is a partial line unless the block starts right after a newline
+        partial = False
+        if position > 0:
+            f.seek(position - 1)
+            partial = f.read(1) != b'\n'
+    lines = data.split(b'\n')
+    if partial:
+        lines = lines[1:]
+    lines = [line for line in lines if line.strip()]
+    return lines[-count:] if count else []
+
+class AgentMemory:
+    """One agent's event log"""
+
+    def __init__(self, directory: Path, agent: str, compact_bytes: int = COMPACT_BYTES):
+        self.agent = agent
+        self.directory = Path(directory) / agent
+        self.log_path = self.directory / 'events.jsonl'
+        self.cold_dir = self.directory / 'cold'
+        self.lock_path = self.directory / '.lock'
+        self.compact_bytes = compact_bytes
+
+    def create(self):
+        self.cold_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path.touch(exist_ok=True)
+
+    @contextmanager
+    def locked(self):
+        """Exclusive lock shared by appends and compaction
+
+        Taken on <agent>/.lock rather than the log itself: compaction replaces the log,
+        and a writer blocked on the old file would otherwise append to an unlinked inode.
+        """
+        self.create()
+        with open(self.lock_path, 'ab') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def segments(self) -> List[Path]:
+        """Cold segments, oldest first"""
+        if not self.cold_dir.exists():
+            return []
+        return sorted(self.cold_dir.glob('cold-*.jsonl'))
+
+    def archived_seq(self) -> int:
+        """Highest sequence number already in a cold segment"""
+        segments = self.segments()
+        return int(segments[-1].stem.split('-')[2]) if segments else 0
+
+    def last_seq(self) -> int:
+        tail = read_tail(self.log_path, 1)
+        return json.loads(tail[0])['seq'] if tail else self.archived_seq()
+
+    def first_seq(self) -> Optional[int]:
+        """Sequence number of the oldest event still in the active log"""
+        try:
+            with open(self.log_path, 'rb') as f:
+                line = f.readline()
+        except FileNotFoundError:
+            return None
+        return json.loads(line)['seq'] if line.strip() else None
+
+    def append(self, event: Dict) -> int:
+        """Record one event; returns its sequence number"""
+        with self.locked():
+            seq = self.last_seq() + 1
+            record = {'seq': seq, 'ts': event.get('ts') or datetime.now().isoformat(), **event}
+            record['seq'] = seq
+            with open(self.log_path, 'ab') as f:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n')
+                size = f.tell()
+        # Only compact once at least WARM_LIMIT events can move, so the cost stays amortized O(1)
+        if size > self.compact_bytes and seq - (self.first_seq() or seq) >= 2 * WARM_LIMIT:
+            self.compact()
+        return seq
+
+    def recent(self, count: int) -> List[Dict]:
+        """The newest `count` events (at most WARM_LIMIT), newest first"""
+        # Compaction always keeps the newest WARM_LIMIT lines, so these are never archived
+        return [json.loads(line) for line in reversed(read_tail(self.log_path, count))]
+
+    def hot(self) -> List[Dict]:
+        """Events 1-20 by recency, newest first (reads only the end of the log)"""
+        return self.recent(HOT_LIMIT)
+
+    def warm(self) -> List[Dict]:
+        """Events 21-100 by recency, newest first"""
+        return self.recent(WARM_LIMIT)[HOT_LIMIT:]
+
+    def cold(self) -> Iterator[Dict]:
+        """Events 101+ by recency, oldest first, streamed from the segments and the log"""
+        archived = 0
+        for segment in self.segments():
+            with open(segment, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            archived = int(segment.stem.split('-')[2])
+        last = self.last_seq()
+        try:
+            f = open(self.log_path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    event = json.loads(line)
+                    if archived < event['seq'] <= last - WARM_LIMIT:
+                        yield event
+
+    def stats(self) -> Dict:
+        total = self.last_seq()
+        return {
+            'agent': self.agent,
+            'events': total,
+            'hot': min(total, HOT_LIMIT),
+            'warm': min(max(total - HOT_LIMIT, 0), WARM_LIMIT - HOT_LIMIT),
+            'cold': max(total - WARM_LIMIT, 0),
+            'log_bytes': self.log_path.stat().st_size if self.log_path.exists() else 0,
+            'cold_segments': len(self.segments()),
+        }
+
+    def compact(self) -> int:
+        """Move events older than the warm tier into a cold segment; returns how many moved
+
+        Crash-safe: the segment is complete on disk (named by its seq range) before the
+        log is replaced, and events at or below the newest segment are never archived twice.
+        """
+        with self.locked():
+            archived = self.archived_seq()
+            with open(self.log_path, 'rb') as f:
+                lines = [line for line in f if line.strip()]
+            if not lines:
+                return 0
+            last = json.loads(lines[-1])['seq']
+            keep = [line for line in lines if json.loads(line)['seq'] > last - WARM_LIMIT]
+            to_archive = [line for line in lines[:len(lines) - len(keep)] if json.loads(line)['seq'] > archived]
+
+            if to_archive:
+                first = json.loads(to_archive[0])['seq']
+                final = json.loads(to_archive[-1])['seq']
+                segment = self.cold_dir / f'cold-{first:010d}-{final:010d}.jsonl'
+                tmp_segment = segment.with_suffix('.tmp')
+                with open(tmp_segment, 'wb') as f:
+                    f.writelines(to_archive)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_segment, segment)
+
+            tmp_log = self.log_path.with_suffix('.tmp')
+            with open(tmp_log, 'wb') as f:
+                f.writelines(keep)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_log, self.log_path)
+            return len(to_archive)
+
+    def export(self) -> Dict:
+        """The <agent>-memory.json document (hot and warm events; cold is referenced, not inlined)"""
+        stats = self.stats()
+        return {
+            'agent_name': self.agent,
+            'last_updated': datetime.now().isoformat(),
+            'hot_memory': {'events': self.hot()},
+            'warm_memory': {'events': self.warm()},
+            'cold_memory': {'event_count': stats['cold'], 'archive': str(self.cold_dir)},
+        }
+
+class MemoryStore:
+    """Every agent's log under one memory directory"""
+
+    def __init__(self, directory: Path = MEMORY_DIR, compact_bytes: int = COMPACT_BYTES):
+        self.directory = Path(directory)
+        self.compact_bytes = compact_bytes
+
+    def agent(self, name: str) -> AgentMemory:
+        return AgentMemory(self.directory, name, self.compact_bytes)
+
+    def agents(self) -> List[str]:
+        if not self.directory.exists():
+            return []
+        return sorted(path.parent.name for path in self.directory.glob('*/events.jsonl'))
+
+    def compact_all(self) -> Dict[str, int]:
+        return {name: self.agent(name).compact() for name in self.agents()}
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Agent memory: append events and read hot/warm/cold tiers")
+    parser.add_argument('--dir', type=Path, default=MEMORY_DIR, help="Memory directory (default: .claude/memory)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    append = sub.add_parser('append', help="Append an event (JSON object, or plain text as a summary)")
+    append.add_argument('agent')
+    append.add_argument('event')
+    for name in ('hot', 'warm', 'cold', 'stats', 'export'):
+        sub.add_parser(name).add_argument('agent')
+    sub.add_parser('compact', help="Compact every agent's log")
+    args = parser.parse_args(argv)
+
+    store = MemoryStore(args.dir)
+    if args.command == 'compact':
+        output = store.compact_all()
+    elif args.command == 'append':
+        try:
+            event = json.loads(args.event)
+        except ValueError:
+            event = {'summary': args.event}
+        if not isinstance(event, dict):
+            event = {'summary': event}
+        output = {'seq': store.agent(args.agent).append(event)}
+    else:
+        memory = store.agent(args.agent)
+        output = list(memory.cold()) if args.command == 'cold' else getattr(memory, args.command)()
+    json.dump(output, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+if __name__ == '__main__':
+    main()
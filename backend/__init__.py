@@ -0,0 +1,3 @@
+"""
+Backend infrastructure for the FastAPI app in main.py
+"""
@@ -0,0 +1,156 @@
+"""
+Admission Control
+Adaptive load shedding: tracks concurrency and event-loop queueing delay
+and rejects excess requests early with 503 + Retry-After once a target is
+exceeded; priority routes (health checks) are always admitted
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Set
+
+CRITICAL = 0
+NORMAL = 1
+SHEDDABLE = 2
+
+
+class LoopLagMonitor:
+    """Samples event-loop scheduling delay with a periodic timer"""
+
+    def __init__(self, interval: float = 0.05, smoothing: float = 0.3):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag = self.smoothing * lag + (1 - self.smoothing) * self.lag
+            self.max_lag = max(self.max_lag, lag)
+
+
+class AdmissionController:
+    """
+    Decides whether a request may enter.
+
+    A request is shed when in-flight requests reach `max_concurrency`, or
+    when the smoothed loop lag exceeds `target_lag`. Under lag, sheddable
+    routes are dropped first and normal routes only once the lag doubles
+    the target; critical routes are never shed.
+
+    Streaming routes (long-lived SSE connections) are counted against
+    `max_streams` instead, so open streams never use up request slots.
+    """
+
+    def __init__(self, max_concurrency: int = 512, target_lag: float = 0.1,
+                 retry_after: int = 1, lag_monitor: Optional[LoopLagMonitor] = None,
+                 max_streams: int = 1000):
+        self.max_concurrency = max_concurrency
+        self.max_streams = max_streams
+        self.target_lag = target_lag
+        self.retry_after = retry_after
+        self.lag_monitor = lag_monitor if lag_monitor is not None else LoopLagMonitor()
+        self.priorities: Dict[str, int] = {}
+        self.streaming: Set[str] = set()
+        self.in_flight = 0
+        self.streams_in_flight = 0
+        self.admitted = 0
+        self.shed: Dict[str, int] = {"concurrency": 0, "streams": 0, "lag": 0}
+
+    def set_priority(self, paths: Iterable[str], priority: int):
+        for path in paths:
+            self.priorities[path] = priority
+
+    def set_streaming(self, paths: Iterable[str]):
+        self.streaming.update(paths)
+
+    def priority(self, path: str) -> int:
+        return self.priorities.get(path, NORMAL)
+
+    def admit(self, path: str) -> Optional[str]:
+        """Return None to admit, or the reason the request is shed"""
+        priority = self.priority(path)
+        if priority == CRITICAL:
+            return None
+        if path in self.streaming:
+            if self.streams_in_flight >= self.max_streams:
+                return "streams"
+        elif self.in_flight >= self.max_concurrency:
+            return "concurrency"
+        lag = self.lag_monitor.lag
+        if lag > self.target_lag and (priority == SHEDDABLE or lag > 2 * self.target_lag):
+            return "lag"
+        return None
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        return [
+            ("admission_admitted_total", "counter", "Requests admitted.", [({}, self.admitted)]),
+            ("admission_shed_total", "counter", "Requests rejected with 503.",
+             [({"reason": reason}, count) for reason, count in self.shed.items()]),
+            ("admission_in_flight", "gauge", "Admitted requests in flight.", [({}, self.in_flight)]),
+            ("admission_streams_in_flight", "gauge", "Open streaming responses.", [({}, self.streams_in_flight)]),
+            ("event_loop_lag_seconds", "gauge", "Smoothed event-loop scheduling delay.",
+             [({}, round(self.lag_monitor.lag, 6))]),
+            ("event_loop_lag_max_seconds", "gauge", "Worst observed event-loop scheduling delay.",
+             [({}, round(self.lag_monitor.max_lag, 6))]),
+        ]
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying an AdmissionController before the app runs"""
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        reason = controller.admit(scope['path'])
+        if reason is not None:
+            controller.shed[reason] += 1
+            body = b'{"detail":"Server overloaded, retry later"}'
+            await send({
+                'type': 'http.response.start',
+                'status': 503,
+                'headers': [
+                    (b'content-type', b'application/json'),
+                    (b'content-length', str(len(body)).encode()),
+                    (b'retry-after', str(controller.retry_after).encode()),
+                ],
+            })
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        controller.admitted += 1
+        if scope['path'] in controller.streaming:
+            controller.streams_in_flight += 1
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                controller.streams_in_flight -= 1
+            return
+
+        controller.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.in_flight -= 1
@@ -0,0 +1,224 @@
+"""
+Agent Communication Board Stream
+Parses AGENT_COMMUNICATION_BOARD.md into per-task entries and fans out
+per-task deltas to Server-Sent Events subscribers from a single watcher
+"""
+import asyncio
+import os
+import re
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from backend.serialization import dumps
+
+SECTIONS = [
+    ("In Progress", "in_progress"),
+    ("Completed", "completed"),
+    ("Paused", "paused"),
+    ("Backlog", "backlog"),
+    ("Blockers", "blockers"),
+]
+
+ENTRY_RE = re.compile(r'^\s*[-*]\s+\*\*\[(?P<id>[^\]]+)\]\*\*\s*(?P<rest>.*)$')
+AGENT_RE = re.compile(r'@[\w.\-]+')
+DETAIL_RE = re.compile(r'\((?P<detail>[^()]*)\)\s*$')
+
+
+def section_key(heading: str) -> Optional[str]:
+    for title, key in SECTIONS:
+        if title.lower() in heading.lower():
+            return key
+    return None
+
+
+def parse_entry(line: str) -> Optional[Dict[str, object]]:
+    match = ENTRY_RE.match(line)
+    if not match:
+        return None
+    rest = match.group('rest').strip()
+    description, _, tail = rest.partition(' – ')
+    if not tail:
+        description, _, tail = rest.partition(' - ')
+    detail = DETAIL_RE.search(tail)
+    return {
+        "id": match.group('id').strip(),
+        "description": description.strip(),
+        "agents": AGENT_RE.findall(tail),
+        "detail": detail.group('detail').strip() if detail else "",
+        "raw": rest,
+    }
+
+
+def parse_board(text: str) -> Dict[str, Dict[str, object]]:
+    """Map task id -> entry (with its section) for every task on the board"""
+    tasks: Dict[str, Dict[str, object]] = {}
+    section = None
+    in_fence = False
+    in_comment = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if in_comment or stripped.startswith('<!--'):
+            in_comment = '-->' not in stripped
+            continue
+        if stripped.startswith('## '):
+            section = section_key(stripped[3:])
+            continue
+        if section is None:
+            continue
+        entry = parse_entry(line)
+        if entry is not None:
+            entry["section"] = section
+            tasks[entry["id"]] = entry
+    return tasks
+
+
+def diff_boards(old: Dict[str, Dict[str, object]], new: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    """Per-task deltas between two parsed boards"""
+    deltas = []
+    for task_id, entry in new.items():
+        previous = old.get(task_id)
+        if previous is None:
+            deltas.append({"type": "added", "task": entry})
+        elif previous["section"] != entry["section"]:
+            deltas.append({"type": "moved", "from": previous["section"], "task": entry})
+        elif previous != entry:
+            deltas.append({"type": "updated", "task": entry})
+    for task_id, entry in old.items():
+        if task_id not in new:
+            deltas.append({"type": "removed", "task": entry})
+    return deltas
+
+
+class BoardWatcher:
+    """
+    One polling watcher per board file, started with the first subscriber
+    and stopped after the last leaves. Each poll is a single stat(); the
+    file is only re-read and re-parsed when its mtime or size changes.
+    """
+
+    def __init__(self, path: str, interval: float = 0.5, max_subscribers: int = 1000,
+                 queue_size: int = 100):
+        self.path = path
+        self.interval = interval
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.tasks: Dict[str, Dict[str, object]] = {}
+        self.version = 0
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.signature: Optional[Tuple[int, int]] = None
+        self.task: Optional[asyncio.Task] = None
+        self.parses = 0
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> str:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    async def refresh(self) -> List[Dict[str, object]]:
+        """Re-parse the board if it changed; returns the deltas that were published"""
+        signature = self._stat()
+        if signature == self.signature:
+            return []
+        self.signature = signature
+        if signature is None:
+            tasks = {}
+        else:
+            text = await asyncio.get_running_loop().run_in_executor(None, self._read)
+            tasks = parse_board(text)
+            self.parses += 1
+        deltas = diff_boards(self.tasks, tasks)
+        self.tasks = tasks
+        if deltas:
+            self.version += 1
+            self._publish({"version": self.version, "deltas": deltas})
+        return deltas
+
+    def _publish(self, event: Dict[str, object]):
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog and make it resync from a snapshot
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"resync": True})
+
+    async def _run(self):
+        # The subscriber that starts the poller does the first refresh
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh()
+
+    def snapshot(self) -> Dict[str, object]:
+        sections: Dict[str, List[Dict[str, object]]] = {key: [] for _, key in SECTIONS}
+        for entry in self.tasks.values():
+            sections[entry["section"]].append(entry)
+        return {"version": self.version, "sections": sections}
+
+    async def subscribe(self) -> asyncio.Queue:
+        if len(self.subscribers) >= self.max_subscribers:
+            raise OverflowError("Too many board subscribers")
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self.subscribers.add(queue)
+        try:
+            if self.task is None or self.task.done():
+                # Assigned before the first await, so concurrent subscribers share one poller
+                self.task = asyncio.create_task(self._run())
+                await self.refresh()
+        except BaseException:
+            self.unsubscribe(queue)
+            raise
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Never awaits: called from a stream's finally, often inside a cancelled scope"""
+        self.subscribers.discard(queue)
+        if not self.subscribers and self.task is not None:
+            task, self.task = self.task, None
+            task.cancel()
+
+    async def stop(self):
+        self.subscribers.clear()
+        # Detach first so a cancellation raised by the await below cannot leave a dead task behind
+        task, self.task = self.task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def sse_event(event: str, data: Dict[str, object], event_id: Optional[int] = None) -> bytes:
+    header = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{header}event: {event}\ndata: ".encode("utf-8") + dumps(data) + b"\n\n"
+
+
+async def sse_stream(watcher: BoardWatcher, queue: asyncio.Queue, heartbeat: float = 15.0) -> AsyncIterator[bytes]:
+    """
+    Snapshot first, then deltas; comment heartbeats keep proxies from timing
+    out. Deltas whose version is not above the snapshot's are already applied.
+    """
+    try:
+        snapshot_version = watcher.version
+        yield b"retry: 3000\n\n" + sse_event("snapshot", watcher.snapshot(), snapshot_version)
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+            if event.get("resync"):
+                snapshot_version = watcher.version
+                yield sse_event("snapshot", watcher.snapshot(), snapshot_version)
+            elif event["version"] > snapshot_version:
+                yield sse_event("delta", event, event["version"])
+    finally:
+        watcher.unsubscribe(queue)
@@ -0,0 +1,195 @@
+"""
+Response Cache
+TTL/LRU cache for GET responses with strong ETags and 304 handling
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class CacheEntry:
+    __slots__ = ('status', 'headers', 'body', 'etag', 'expires', 'route')
+
+    def __init__(self, status: int, headers: Headers, body: bytes, etag: bytes, expires: float,
+                 route=None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+        # Route that produced the response, restored into the scope of hits (never routed)
+        self.route = route
+
+
+class ResponseCache:
+    """Bounded LRU of rendered responses, keyed on path plus query string"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[bytes, CacheEntry]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def get(self, key: bytes) -> Optional[CacheEntry]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: bytes, entry: CacheEntry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        return [
+            ("response_cache_hits_total", "counter", "Responses served from cache.", [({}, self.hits)]),
+            ("response_cache_misses_total", "counter", "Cache lookups that ran the handler.", [({}, self.misses)]),
+            ("response_cache_not_modified_total", "counter", "304 responses sent.", [({}, self.not_modified)]),
+            ("response_cache_evictions_total", "counter", "Entries evicted by the LRU bound.", [({}, self.evictions)]),
+            ("response_cache_entries", "gauge", "Entries currently cached.", [({}, len(self.entries))]),
+        ]
+
+
+def make_etag(body: bytes) -> bytes:
+    """Strong ETag derived from the response body"""
+    return b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Check an If-None-Match header value against a strong ETag"""
+    if if_none_match.strip() == b'*':
+        return True
+    for candidate in if_none_match.split(b','):
+        candidate = candidate.strip()
+        if candidate.startswith(b'W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware serving cached GET/HEAD responses for configured routes.
+
+    `routes` maps a request path to its TTL in seconds; other paths pass
+    straight through. Only 200 responses without Set-Cookie or no-store
+    are cached.
+    """
+
+    def __init__(self, app, routes: Dict[str, float], cache: Optional[ResponseCache] = None,
+                 max_entries: int = 1024):
+        self.app = app
+        self.routes = dict(routes)
+        self.cache = cache if cache is not None else ResponseCache(max_entries)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.app(scope, receive, send)
+            return
+
+        ttl = self.routes.get(scope['path'])
+        if ttl is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = scope['path'].encode() + b'?' + scope.get('query_string', b'')
+        if_none_match = None
+        for name, value in scope['headers']:
+            if name == b'if-none-match':
+                if_none_match = value
+                break
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.hits += 1
+            if entry.route is not None:
+                # Lets outer middleware (metrics) label the hit with its route template
+                scope['route'] = entry.route
+            await self._send_entry(entry, if_none_match, scope['method'] == 'HEAD', b'HIT', send)
+            return
+
+        self.cache.misses += 1
+        start_message = {}
+        chunks = []
+
+        async def capture(message):
+            if message['type'] == 'http.response.start':
+                start_message.update(message)
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+            else:
+                await send(message)
+
+        await self.app(scope, receive, capture)
+
+        body = b''.join(chunks)
+        status = start_message.get('status', 500)
+        headers = [
+            (name, value) for name, value in start_message.get('headers', [])
+            if name not in (b'etag', b'x-cache')
+        ]
+        etag = make_etag(body)
+        entry = CacheEntry(status, headers, body, etag, time.monotonic() + ttl, scope.get('route'))
+
+        if status == 200 and self._storable(headers):
+            self.cache.put(key, entry)
+        await self._send_entry(entry, if_none_match, scope['method'] == 'HEAD', b'MISS', send)
+
+    @staticmethod
+    def _storable(headers: Headers) -> bool:
+        for name, value in headers:
+            if name == b'set-cookie':
+                return False
+            if name == b'cache-control' and (b'no-store' in value or b'private' in value):
+                return False
+        return True
+
+    async def _send_entry(self, entry: CacheEntry, if_none_match: Optional[bytes],
+                          head_only: bool, cache_status: bytes, send):
+        if entry.status == 200 and if_none_match is not None and etag_matches(if_none_match, entry.etag):
+            self.cache.not_modified += 1
+            headers = [
+                (name, value) for name, value in entry.headers
+                if name not in (b'content-length', b'content-type')
+            ]
+            headers.append((b'etag', entry.etag))
+            headers.append((b'x-cache', cache_status))
+            await send({'type': 'http.response.start', 'status': 304, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        headers = list(entry.headers)
+        if entry.status == 200:
+            headers.append((b'etag', entry.etag))
+        headers.append((b'x-cache', cache_status))
+        await send({'type': 'http.response.start', 'status': entry.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'' if head_only else entry.body})
@@ -0,0 +1,107 @@
+"""
+Request Coalescing
+Singleflight for async functions: identical concurrent calls share one
+computation and every waiter receives its result (or its exception)
+"""
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Tracks in-flight computations by key.
+
+    A cancelled waiter only detaches itself; the shared computation is
+    cancelled once its last waiter has gone.
+    """
+
+    def __init__(self):
+        self.flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        flight = self.flights.get(key)
+        if flight is None:
+            self.executions += 1
+            flight = self.flights[key] = _Flight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(functools.partial(self._finish, key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.task.cancelled() or flight.waiters > 1:
+                raise
+            # Last waiter went away: stop the computation nobody is waiting for
+            self.abandoned += 1
+            if self.flights.get(key) is flight:
+                del self.flights[key]
+            flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: Hashable, flight: _Flight, task: asyncio.Task):
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def coalesce(self, key_fn: Optional[Callable[..., Hashable]] = None):
+        """
+        Decorator for async functions; calls with equal arguments coalesce.
+
+        Every waiter receives the same object, so decorate the function that
+        computes the payload, not a route returning a Response: Starlette and
+        the middleware modify responses per request. The default key is the
+        function plus its arguments; others need a custom key_fn.
+        """
+        def decorator(fn: Callable[..., Awaitable[Any]]):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                if key_fn is not None:
+                    key = key_fn(*args, **kwargs)
+                else:
+                    key = (fn.__qualname__, args, tuple(sorted(kwargs.items())))
+                return await self.do(key, lambda: fn(*args, **kwargs))
+            return wrapper
+        return decorator
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "abandoned": self.abandoned,
+            "in_flight": len(self.flights),
+        }
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        return [
+            ("singleflight_calls_total", "counter", "Calls through coalesced functions.", [({}, self.calls)]),
+            ("singleflight_executions_total", "counter", "Computations actually run.", [({}, self.executions)]),
+            ("singleflight_coalesced_total", "counter", "Calls that joined an in-flight computation.",
+             [({}, self.coalesced)]),
+            ("singleflight_errors_total", "counter", "Shared computations that raised.", [({}, self.errors)]),
+            ("singleflight_abandoned_total", "counter", "Computations cancelled after their last waiter left.",
+             [({}, self.abandoned)]),
+            ("singleflight_in_flight", "gauge", "Computations currently in flight.", [({}, len(self.flights))]),
+        ]
@@ -0,0 +1,276 @@
+"""
+Response Compression
+Negotiated gzip/brotli compression with a minimum-size threshold, levels
+chosen per content type, and a cache of precompressed bodies for
+responses that carry an ETag
+"""
+import gzip
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content-type prefix -> (gzip level, brotli quality); first match wins
+COMPRESSION_LEVELS: List[Tuple[str, Tuple[int, int]]] = [
+    ("application/x-ndjson", (1, 1)),  # streamed; favor latency
+    ("text/event-stream", (1, 1)),
+    ("application/json", (6, 5)),
+    ("text/", (6, 5)),
+    ("application/javascript", (6, 5)),
+    ("application/xml", (6, 5)),
+    ("image/svg+xml", (6, 5)),
+]
+
+# Precompressed bodies are encoded once, so spend more CPU on them
+PRECOMPRESSED_LEVELS = (9, 11)
+
+
+def levels_for(content_type: str) -> Optional[Tuple[int, int]]:
+    for prefix, levels in COMPRESSION_LEVELS:
+        if content_type.startswith(prefix):
+            return levels
+    return None
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, honoring q=0"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get('*', 0.0)
+    if brotli is not None and accepted.get('br', wildcard) > 0:
+        return 'br'
+    if accepted.get('gzip', wildcard) > 0:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str, levels: Tuple[int, int]) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=levels[1])
+    return gzip.compress(body, compresslevel=levels[0], mtime=0)
+
+
+class StreamCompressor:
+    """Incremental compressor that flushes each chunk so streams stay live"""
+
+    def __init__(self, encoding: str, levels: Tuple[int, int]):
+        self.encoding = encoding
+        if encoding == 'br':
+            self.compressor = brotli.Compressor(quality=levels[1])
+        else:
+            self.compressor = zlib.compressobj(levels[0], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == 'br':
+            return self.compressor.process(data) + self.compressor.flush()
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == 'br':
+            return self.compressor.finish()
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionStats:
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.bytes_in: Dict[str, int] = {}
+        self.bytes_out: Dict[str, int] = {}
+        self.responses: Dict[str, int] = {}
+        self.precompressed_hits = 0
+        self.skipped_small = 0
+
+    def record(self, encoding: str, elapsed: float, size_in: int, size_out: int, response: bool = True):
+        self.seconds[encoding] = self.seconds.get(encoding, 0.0) + elapsed
+        self.bytes_in[encoding] = self.bytes_in.get(encoding, 0) + size_in
+        self.bytes_out[encoding] = self.bytes_out.get(encoding, 0) + size_out
+        if response:
+            self.responses[encoding] = self.responses.get(encoding, 0) + 1
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        encodings = sorted(self.seconds)
+        return [
+            ("http_compression_seconds_total", "counter", "Time spent compressing responses.",
+             [({"encoding": e}, round(self.seconds[e], 6)) for e in encodings]),
+            ("http_compression_responses_total", "counter", "Responses compressed.",
+             [({"encoding": e}, self.responses.get(e, 0)) for e in encodings]),
+            ("http_compression_bytes_in_total", "counter", "Uncompressed bytes.",
+             [({"encoding": e}, self.bytes_in[e]) for e in encodings]),
+            ("http_compression_bytes_out_total", "counter", "Compressed bytes sent.",
+             [({"encoding": e}, self.bytes_out[e]) for e in encodings]),
+            ("http_compression_precompressed_hits_total", "counter", "Bodies served from the precompressed cache.",
+             [({}, self.precompressed_hits)]),
+            ("http_compression_skipped_small_total", "counter", "Responses below the size threshold.",
+             [({}, self.skipped_small)]),
+        ]
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing compressible responses of at least
+    `minimum_size` bytes. Responses with an ETag on `precompress_paths`
+    (long-lived cache entries) are compressed once at a high level and
+    served from an LRU afterwards; other responses use the per-type levels,
+    so per-query ETags cannot make every request pay maximum compression.
+    Compressed ETags become weak so If-None-Match still matches the
+    identity representation.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, precompressed_entries: int = 512,
+                 stats: Optional[CompressionStats] = None, precompress_paths: Iterable[str] = ()):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.precompress_paths = frozenset(precompress_paths)
+        self.precompressed_entries = precompressed_entries
+        self.precompressed: 'OrderedDict[Tuple[bytes, str], bytes]' = OrderedDict()
+        self.stats = stats if stats is not None else CompressionStats()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] == 'HEAD':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        for name, value in scope['headers']:
+            if name == b'accept-encoding':
+                encoding = negotiate(value.decode('latin-1'))
+                break
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = {'start': None, 'levels': None, 'stream': None}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                headers = message.get('headers', [])
+                content_type = b''
+                for name, value in headers:
+                    if name == b'content-encoding':
+                        await send(message)  # already encoded upstream
+                        return
+                    if name == b'content-type':
+                        content_type = value
+                levels = levels_for(content_type.decode('latin-1'))
+                if levels is None or message['status'] in (204, 304):
+                    await send(message)
+                    return
+                state['start'] = message
+                state['levels'] = levels
+                return
+
+            if message['type'] != 'http.response.body' or state['start'] is None:
+                await send(message)
+                return
+
+            start = state['start']
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+            if state['stream'] is not None:
+                await self._send_stream_chunk(state['stream'], body, more_body, send)
+                return
+
+            if not more_body:
+                await self._send_whole(start, body, encoding, state['levels'], send,
+                                       scope['path'] in self.precompress_paths)
+                state['start'] = None
+                return
+
+            # First chunk of a streamed body: compress incrementally
+            state['stream'] = StreamCompressor(encoding, state['levels'])
+            headers = self._encoded_headers(start['headers'], encoding, None)
+            await send({**start, 'headers': headers})
+            await self._send_stream_chunk(state['stream'], body, more_body, send)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_stream_chunk(self, stream: StreamCompressor, body: bytes, more_body: bool, send):
+        began = time.perf_counter()
+        data = stream.chunk(body) if body else b''
+        if not more_body:
+            data += stream.finish()
+        self.stats.record(stream.encoding, time.perf_counter() - began, len(body), len(data), response=not more_body)
+        await send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+
+    async def _send_whole(self, start, body: bytes, encoding: str, levels: Tuple[int, int], send,
+                          precompress: bool = False):
+        if len(body) < self.minimum_size:
+            self.stats.skipped_small += 1
+            await send({**start, 'headers': self._vary(start['headers'])})
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        etag = None
+        if precompress:
+            for name, value in start['headers']:
+                if name == b'etag':
+                    etag = value
+                    break
+
+        compressed = None
+        if etag is not None:
+            compressed = self.precompressed.get((etag, encoding))
+            if compressed is not None:
+                self.precompressed.move_to_end((etag, encoding))
+                self.stats.precompressed_hits += 1
+
+        if compressed is None:
+            began = time.perf_counter()
+            compressed = compress(body, encoding, PRECOMPRESSED_LEVELS if etag is not None else levels)
+            self.stats.record(encoding, time.perf_counter() - began, len(body), len(compressed))
+            if etag is not None:
+                self.precompressed[(etag, encoding)] = compressed
+                while len(self.precompressed) > self.precompressed_entries:
+                    self.precompressed.popitem(last=False)
+
+        if len(compressed) >= len(body):
+            await send({**start, 'headers': self._vary(start['headers'])})
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        headers = self._encoded_headers(start['headers'], encoding, len(compressed))
+        await send({**start, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': compressed})
+
+    @staticmethod
+    def _vary(headers) -> List[Tuple[bytes, bytes]]:
+        result = []
+        vary_added = False
+        for name, value in headers:
+            if name == b'vary':
+                if b'accept-encoding' not in value.lower():
+                    value = value + b', Accept-Encoding'
+                vary_added = True
+            result.append((name, value))
+        if not vary_added:
+            result.append((b'vary', b'Accept-Encoding'))
+        return result
+
+    def _encoded_headers(self, headers, encoding: str, length: Optional[int]) -> List[Tuple[bytes, bytes]]:
+        result = []
+        for name, value in self._vary(headers):
+            if name == b'content-length':
+                continue
+            if name == b'etag' and not value.startswith(b'W/'):
+                value = b'W/' + value
+            result.append((name, value))
+        result.append((b'content-encoding', encoding.encode()))
+        if length is not None:
+            result.append((b'content-length', str(length).encode()))
+        return result
@@ -0,0 +1,162 @@
+"""
+Health Checks
+Liveness/readiness support with dependency probes that run in the
+background on a schedule; readiness requests only read the last result
+"""
+import asyncio
+import inspect
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+ProbeFn = Callable[[], Union[bool, Awaitable[bool]]]
+
+
+class ProbeResult:
+    __slots__ = ('ok', 'detail', 'latency', 'checked_at')
+
+    def __init__(self, ok: Optional[bool], detail: str = "", latency: float = 0.0,
+                 checked_at: Optional[str] = None):
+        self.ok = ok
+        self.detail = detail
+        self.latency = latency
+        self.checked_at = checked_at
+
+    def to_dict(self) -> Dict[str, object]:
+        if self.ok is None:
+            status = "pending"
+        else:
+            status = "ok" if self.ok else "failing"
+        return {
+            "status": status,
+            "detail": self.detail,
+            "latency_ms": round(self.latency * 1000, 3),
+            "checked_at": self.checked_at,
+        }
+
+
+class Probe:
+    __slots__ = ('name', 'fn', 'interval', 'timeout', 'critical', 'result', 'task')
+
+    def __init__(self, name: str, fn: ProbeFn, interval: float, timeout: float, critical: bool):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.timeout = timeout
+        self.critical = critical
+        self.result = ProbeResult(None, "not yet checked")
+        self.task: Optional[asyncio.Task] = None
+
+
+class HealthMonitor:
+    """Runs registered dependency probes on a schedule and caches their results"""
+
+    def __init__(self):
+        self.probes: Dict[str, Probe] = {}
+        self.stopping = False
+
+    def register(self, name: str, fn: ProbeFn, interval: float = 10.0, timeout: float = 2.0,
+                 critical: bool = True):
+        """Register a probe; sync probes run in a worker thread"""
+        self.probes[name] = Probe(name, fn, interval, timeout, critical)
+
+    async def start(self):
+        self.stopping = False
+        for probe in self.probes.values():
+            if probe.task is None:
+                probe.task = asyncio.create_task(self._run(probe))
+
+    async def stop(self):
+        self.stopping = True
+        tasks = [probe.task for probe in self.probes.values() if probe.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for probe in self.probes.values():
+            probe.task = None
+
+    async def check(self, probe: Probe) -> ProbeResult:
+        """Run one probe immediately and store its result"""
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(probe.fn):
+                outcome = await asyncio.wait_for(probe.fn(), probe.timeout)
+            else:
+                loop = asyncio.get_running_loop()
+                outcome = await asyncio.wait_for(loop.run_in_executor(None, probe.fn), probe.timeout)
+            ok, detail = bool(outcome), "ok" if outcome else "probe returned false"
+        except asyncio.TimeoutError:
+            ok, detail = False, f"timed out after {probe.timeout}s"
+        except Exception as e:
+            ok, detail = False, str(e) or type(e).__name__
+        probe.result = ProbeResult(ok, detail, time.perf_counter() - start, datetime.now().isoformat())
+        return probe.result
+
+    async def _run(self, probe: Probe):
+        # wait_for() can swallow a cancel that races the probe finishing,
+        # so the loop also honors the stopping flag
+        while not self.stopping:
+            await self.check(probe)
+            if self.stopping:
+                break
+            await asyncio.sleep(probe.interval)
+
+    def readiness(self) -> Dict[str, object]:
+        """Last cached probe results; ready only when every critical probe passed"""
+        ready = all(probe.result.ok for probe in self.probes.values() if probe.critical)
+        return {
+            "status": "ready" if ready else "not_ready",
+            "checks": {name: probe.result.to_dict() for name, probe in self.probes.items()},
+        }
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        return [
+            ("health_probe_up", "gauge", "1 if the dependency probe last passed.",
+             [({"probe": name}, 1 if probe.result.ok else 0) for name, probe in self.probes.items()]),
+            ("health_probe_latency_seconds", "gauge", "Duration of the last probe run.",
+             [({"probe": name}, round(probe.result.latency, 6)) for name, probe in self.probes.items()]),
+        ]
+
+
+def disk_probe(path: str = ".", min_free_bytes: int = 100 * 1024 * 1024) -> ProbeFn:
+    """Probe that fails when free disk space drops below a threshold"""
+    def probe() -> bool:
+        free = shutil.disk_usage(path).free
+        if free < min_free_bytes:
+            raise Exception(f"{free // (1024 * 1024)} MiB free (minimum {min_free_bytes // (1024 * 1024)} MiB)")
+        return True
+    return probe
+
+
+def tcp_probe(url: str, default_port: int) -> ProbeFn:
+    """Probe that opens (and closes) a TCP connection to the host in a service URL"""
+    parsed = urlparse(url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or default_port
+
+    async def probe() -> bool:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.close()
+        await writer.wait_closed()
+        return True
+    return probe
+
+
+def url_probes(env: Dict[str, str]) -> List[tuple]:
+    """Default (name, probe) pairs for DATABASE_URL and REDIS_URL when configured"""
+    probes = []
+    database_url = env.get("DATABASE_URL")
+    if database_url:
+        if database_url.startswith("sqlite"):
+            db_path = urlparse(database_url).path[1:] or ":memory:"
+            probes.append(("database", lambda: db_path == ":memory:" or os.path.exists(db_path)))
+        else:
+            probes.append(("database", tcp_probe(database_url, 5432)))
+    redis_url = env.get("REDIS_URL")
+    if redis_url:
+        probes.append(("cache", tcp_probe(redis_url, 6379)))
+    return probes
@@ -0,0 +1,70 @@
+"""
+NDJSON Streaming
+Incremental newline-delimited JSON parsing of request bodies and chunked
+NDJSON encoding of response streams
+"""
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from starlette.responses import StreamingResponse
+
+from backend.serialization import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that may keep reading the request body while it streams.
+
+    Starlette's disconnect listener would compete with request.stream() for
+    receive(); a disconnect surfaces as ClientDisconnect from the body
+    stream instead.
+    """
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        async for chunk in self.body_iterator:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes], max_line_bytes: int = 64 * 1024) -> AsyncIterator[Any]:
+    """Parse an NDJSON byte stream one line at a time; blank lines are skipped"""
+    buffer = b""
+    async for chunk in chunks:
+        if b"\n" not in chunk:
+            buffer += chunk
+        else:
+            # One split per chunk; the last piece is the start of the next line
+            lines = chunk.split(b"\n")
+            lines[0] = buffer + lines[0]
+            buffer = lines.pop()
+            for line in lines:
+                if len(line) > max_line_bytes:
+                    raise ValueError(f"NDJSON line exceeds {max_line_bytes} bytes")
+                if line.strip():
+                    yield json.loads(line)
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"NDJSON line exceeds {max_line_bytes} bytes")
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+async def encode_ndjson(items: AsyncIterable[Any], batch_size: int = 64) -> AsyncIterator[bytes]:
+    """Encode items as NDJSON, grouping lines to cut per-chunk send overhead"""
+    lines = []
+    async for item in items:
+        lines.append(dumps(item))
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def iter_items(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Adapt an in-memory iterable to the async item stream the helpers above use"""
+    for item in items:
+        yield item
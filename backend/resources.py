@@ -0,0 +1,301 @@
+"""
+Shared Resources
+Lifespan-managed registry of bounded async connection pools: built and
+warmed at startup, handed to routes through dependency injection, and
+closed on shutdown. SQLite (stdlib) serves as the offline stand-in for
+DATABASE_URL; PostgreSQL and Redis use asyncpg / redis when installed
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class PoolUnavailable(Exception):
+    """The pool's backend cannot be used (e.g. its optional driver is not installed)"""
+
+
+class AsyncPool:
+    """Bounded pool of connections with wait-time and utilization stats"""
+
+    def __init__(self, name: str, create: Callable[[], Awaitable[Any]],
+                 close: Callable[[Any], Awaitable[None]], min_size: int = 1, max_size: int = 10,
+                 warm: Optional[Callable[[Any], Awaitable[None]]] = None, acquire_timeout: float = 10.0):
+        self.name = name
+        self.create = create
+        self.close_connection = close
+        self.min_size = min_size
+        self.max_size = max_size
+        self.warm = warm
+        self.acquire_timeout = acquire_timeout
+        self.idle: deque = deque()
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.size = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.closed = False
+        self.last_error: Optional[str] = None
+
+    async def open(self):
+        """Create and warm min_size connections; an unreachable backend does not block startup"""
+        self.semaphore = asyncio.Semaphore(self.max_size)
+        self.closed = False
+        try:
+            for _ in range(self.min_size):
+                self.idle.append(await self._new_connection())
+        except Exception as e:
+            self.last_error = str(e) or type(e).__name__
+
+    async def close(self):
+        self.closed = True
+        while self.idle:
+            await self.close_connection(self.idle.popleft())
+            self.size -= 1
+
+    async def _new_connection(self):
+        connection = await self.create()
+        self.size += 1
+        if self.warm is not None:
+            try:
+                await self.warm(connection)
+            except BaseException:
+                self.size -= 1
+                await self.close_connection(connection)
+                raise
+        return connection
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.closed or self.semaphore is None:
+            raise RuntimeError(f"Pool '{self.name}' is not open")
+
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PoolTimeout(f"Timed out after {self.acquire_timeout}s waiting for '{self.name}'")
+        finally:
+            self.waiting -= 1
+        waited = time.perf_counter() - started
+        self.acquisitions += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        try:
+            connection = self.idle.pop() if self.idle else await self._new_connection()
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+        self.in_use += 1
+        try:
+            yield connection
+        finally:
+            self.in_use -= 1
+            if self.closed:
+                await self.close_connection(connection)
+                self.size -= 1
+            else:
+                self.idle.append(connection)
+            self.semaphore.release()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "idle": len(self.idle),
+            "waiting": self.waiting,
+            "max_size": self.max_size,
+            "utilization": round(self.in_use / self.max_size, 4) if self.max_size else 0.0,
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds, 6),
+            "max_wait_seconds": round(self.max_wait_seconds, 6),
+            "last_error": self.last_error,
+        }
+
+
+class SQLiteConnection:
+    """Async facade over a sqlite3 connection; calls run in the default executor"""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def execute(self, sql: str, parameters=()) -> int:
+        def run():
+            cursor = self.connection.execute(sql, parameters)
+            self.connection.commit()
+            return cursor.rowcount
+        return await self._run(run)
+
+    async def fetchall(self, sql: str, parameters=()) -> list:
+        return await self._run(lambda: self.connection.execute(sql, parameters).fetchall())
+
+    async def fetchone(self, sql: str, parameters=()):
+        return await self._run(lambda: self.connection.execute(sql, parameters).fetchone())
+
+    async def close(self):
+        await self._run(self.connection.close)
+
+
+def sqlite_pool(name: str, url: str, min_size: int = 1, max_size: int = 5) -> AsyncPool:
+    """Pool for sqlite:///path URLs; sqlite:///:memory: is shared across the pool"""
+    path = urlparse(url).path[1:] or ":memory:"
+    if path == ":memory:":
+        database, uri = f"file:{name}?mode=memory&cache=shared", True
+    else:
+        database, uri = path, False
+
+    async def create():
+        loop = asyncio.get_running_loop()
+        connection = await loop.run_in_executor(
+            None, lambda: sqlite3.connect(database, uri=uri, check_same_thread=False)
+        )
+        return SQLiteConnection(connection)
+
+    async def close(connection: SQLiteConnection):
+        await connection.close()
+
+    async def warm(connection: SQLiteConnection):
+        await connection.fetchone("SELECT 1")
+
+    return AsyncPool(name, create, close, min_size=min_size, max_size=max_size, warm=warm)
+
+
+def unavailable_pool(name: str, reason: str, max_size: int = 1) -> AsyncPool:
+    """Pool for a backend whose optional driver is missing: startup continues, the
+    reason is kept in last_error, and acquiring a connection raises it"""
+    logger.warning("Pool '%s' disabled: %s", name, reason)
+
+    async def create():
+        raise PoolUnavailable(reason)
+
+    async def close(connection):
+        pass
+
+    pool = AsyncPool(name, create, close, min_size=0, max_size=max_size)
+    pool.last_error = reason
+    return pool
+
+
+def postgres_pool(name: str, url: str, min_size: int = 2, max_size: int = 10) -> AsyncPool:
+    try:
+        import asyncpg
+    except ImportError:
+        return unavailable_pool(name, "DATABASE_URL is PostgreSQL but asyncpg is not installed (pip install asyncpg)")
+
+    async def warm(connection):
+        await connection.fetchval("SELECT 1")
+
+    async def close(connection):
+        await connection.close()
+
+    return AsyncPool(name, lambda: asyncpg.connect(url), close, min_size=min_size, max_size=max_size, warm=warm)
+
+
+def redis_pool(name: str, url: str, min_size: int = 2, max_size: int = 20) -> AsyncPool:
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        return unavailable_pool(name, "REDIS_URL is set but redis is not installed (pip install redis)")
+
+    async def create():
+        return aioredis.Redis.from_url(url, single_connection_client=True)
+
+    async def warm(connection):
+        await connection.ping()
+
+    async def close(connection):
+        closer = getattr(connection, 'aclose', None) or connection.close
+        await closer()
+
+    return AsyncPool(name, create, close, min_size=min_size, max_size=max_size, warm=warm)
+
+
+def pool_from_url(name: str, url: str, **kwargs) -> AsyncPool:
+    scheme = urlparse(url).scheme.split('+')[0]
+    if scheme == 'sqlite':
+        return sqlite_pool(name, url, **kwargs)
+    if scheme in ('postgres', 'postgresql'):
+        return postgres_pool(name, url, **kwargs)
+    if scheme in ('redis', 'rediss'):
+        return redis_pool(name, url, **kwargs)
+    raise ValueError(f"Unsupported URL scheme for pool '{name}': {scheme}")
+
+
+class ResourceRegistry:
+    """Named pools opened in the app lifespan and injected into routes"""
+
+    def __init__(self):
+        self.pools: Dict[str, AsyncPool] = {}
+
+    def register(self, pool: AsyncPool) -> AsyncPool:
+        self.pools[pool.name] = pool
+        return pool
+
+    def get(self, name: str) -> AsyncPool:
+        return self.pools[name]
+
+    async def startup(self):
+        opened = []
+        try:
+            for pool in self.pools.values():
+                await pool.open()
+                opened.append(pool)
+        except BaseException:
+            for pool in reversed(opened):
+                await pool.close()
+            raise
+
+    async def shutdown(self):
+        for pool in reversed(list(self.pools.values())):
+            await pool.close()
+
+    def connection(self, name: str):
+        """FastAPI dependency yielding a pooled connection for one request"""
+        async def dependency():
+            async with self.get(name).acquire() as connection:
+                yield connection
+        dependency.__name__ = f"{name}_connection"
+        return dependency
+
+    def collect(self):
+        """Metrics collector for backend.metrics.MetricsRegistry"""
+        stats = {name: pool.stats() for name, pool in self.pools.items()}
+        gauges = [
+            ("pool_size", "Open connections.", "size"),
+            ("pool_in_use", "Connections checked out.", "in_use"),
+            ("pool_waiting", "Tasks waiting for a connection.", "waiting"),
+            ("pool_utilization", "Fraction of max_size in use.", "utilization"),
+            ("pool_max_wait_seconds", "Longest wait for a connection.", "max_wait_seconds"),
+        ]
+        counters = [
+            ("pool_acquisitions_total", "Connections handed out.", "acquisitions"),
+            ("pool_timeouts_total", "Acquire attempts that timed out.", "timeouts"),
+            ("pool_wait_seconds_total", "Total time spent waiting for connections.", "wait_seconds_total"),
+        ]
+        samples = []
+        for metric, help_text, key in gauges:
+            samples.append((metric, "gauge", help_text, [({"pool": n}, s[key]) for n, s in stats.items()]))
+        for metric, help_text, key in counters:
+            samples.append((metric, "counter", help_text, [({"pool": n}, s[key]) for n, s in stats.items()]))
+        return samples
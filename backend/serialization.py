@@ -0,0 +1,105 @@
+"""
+JSON Serialization
+App-wide response class backed by orjson or msgspec when installed,
+falling back to the stdlib json module, plus pre-encoded static bodies
+
+Select a backend with JSON_BACKEND=auto|orjson|msgspec|stdlib (default auto).
+"""
+import json
+import os
+from typing import Any, Callable, Dict, Tuple
+
+from starlette.responses import JSONResponse, Response
+
+
+def _stdlib_encoder() -> Callable[[Any], bytes]:
+    def encode(content: Any) -> bytes:
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+    return encode
+
+
+def _orjson_encoder() -> Callable[[Any], bytes]:
+    import orjson
+    option = orjson.OPT_NON_STR_KEYS
+
+    def encode(content: Any) -> bytes:
+        return orjson.dumps(content, option=option)
+    return encode
+
+
+def _msgspec_encoder() -> Callable[[Any], bytes]:
+    import msgspec
+    return msgspec.json.Encoder().encode
+
+
+ENCODERS: Dict[str, Callable[[], Callable[[Any], bytes]]] = {
+    "orjson": _orjson_encoder,
+    "msgspec": _msgspec_encoder,
+    "stdlib": _stdlib_encoder,
+}
+
+
+def select_encoder(preference: str = "auto") -> Tuple[str, Callable[[Any], bytes]]:
+    """Return (backend name, encode function) for the preferred or first available backend"""
+    candidates = list(ENCODERS) if preference == "auto" else [preference, "stdlib"]
+    for name in candidates:
+        try:
+            return name, ENCODERS[name]()
+        except (ImportError, KeyError):
+            continue
+    return "stdlib", _stdlib_encoder()
+
+
+JSON_BACKEND, dumps = select_encoder(os.environ.get("JSON_BACKEND", "auto"))
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the selected backend"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class PreEncodedJSONResponse(Response):
+    """Response for a body that was already encoded to JSON bytes"""
+    media_type = "application/json"
+
+
+def pre_encode(content: Any) -> bytes:
+    """Encode a static payload once at startup"""
+    return dumps(content)
+
+
+def benchmark(iterations: int = 50000):
+    """Compare per-request serialization cost across backends"""
+    import timeit
+    from datetime import datetime
+    from fastapi.encoders import jsonable_encoder
+
+    payloads = {
+        "root": {"message": "Claude Code Project Template API", "status": "running", "docs": "/docs"},
+        "hello": {"message": "Hello, World!", "timestamp": datetime.now().isoformat()},
+    }
+
+    print(f"Selected backend: {JSON_BACKEND}\n")
+    print(f"{'payload':<8} {'path':<38} {'µs/op':>8}")
+    for payload_name, payload in payloads.items():
+        cases = [("jsonable_encoder + JSONResponse", lambda: JSONResponse(jsonable_encoder(payload)))]
+        for name, factory in ENCODERS.items():
+            try:
+                encode = factory()
+            except ImportError:
+                continue
+            cases.append((name, lambda encode=encode: PreEncodedJSONResponse(encode(payload))))
+        body = pre_encode(payload)
+        cases.append(("pre-encoded bytes", lambda: PreEncodedJSONResponse(body)))
+
+        for label, fn in cases:
+            seconds = timeit.timeit(fn, number=iterations)
+            print(f"{payload_name:<8} {label:<38} {seconds / iterations * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
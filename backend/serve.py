@@ -0,0 +1,122 @@
+"""
+Production Server
+Runs main:app under uvicorn with workers sized from available CPUs,
+uvloop/httptools when installed, tuned keep-alive/backlog and a graceful
+drain of in-flight requests on SIGTERM
+
+Usage:
+    python -m backend.serve [--workers N] [--port 8000] ...
+"""
+import argparse
+import importlib.util
+import os
+import sys
+from typing import Dict, List, Optional
+
+# Colors
+GREEN = '\033[92m'
+BOLD = '\033[1m'
+END = '\033[0m'
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honoring affinity masks and cgroup v2 quotas"""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max', 'r') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            count = min(count, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, count)
+
+
+def has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def build_config(args: argparse.Namespace) -> Dict[str, object]:
+    """Resolve CLI arguments into uvicorn.run keyword arguments"""
+    workers = args.workers or int(os.environ.get('WEB_CONCURRENCY', 0)) or available_cpus()
+    if args.reload:
+        workers = 1
+
+    if args.loop == 'auto':
+        loop = 'uvloop' if has_module('uvloop') and sys.platform != 'win32' else 'asyncio'
+    else:
+        loop = args.loop
+
+    if args.http == 'auto':
+        http = 'httptools' if has_module('httptools') else 'h11'
+    else:
+        http = args.http
+
+    return {
+        'host': args.host,
+        'port': args.port,
+        'workers': workers,
+        'loop': loop,
+        'http': http,
+        'backlog': args.backlog,
+        'timeout_keep_alive': args.keep_alive,
+        'timeout_graceful_shutdown': args.graceful_timeout,
+        'limit_concurrency': args.limit_concurrency,
+        'access_log': args.access_log,
+        'proxy_headers': True,
+        'reload': args.reload,
+    }
+
+
+def print_config(app: str, config: Dict[str, object]):
+    print(f"\n{BOLD}Starting {app}{END}")
+    for key, value in config.items():
+        print(f"  {key:<26} {value}")
+    print(f"  {'cpus_available':<26} {available_cpus()}")
+    print(f"{GREEN}✅ SIGTERM drains in-flight requests for up to "
+          f"{config['timeout_graceful_shutdown']}s{END}\n", flush=True)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the FastAPI app in production mode")
+    parser.add_argument('app', nargs='?', default='main:app', help="ASGI app import string")
+    parser.add_argument('--host', default=os.environ.get('HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8000)))
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Worker processes (default: $WEB_CONCURRENCY or available CPUs)")
+    parser.add_argument('--loop', choices=['auto', 'uvloop', 'asyncio'], default='auto')
+    parser.add_argument('--http', choices=['auto', 'httptools', 'h11'], default='auto')
+    parser.add_argument('--backlog', type=int, default=2048,
+                        help="Listen backlog (capped by net.core.somaxconn)")
+    parser.add_argument('--keep-alive', type=int, default=75,
+                        help="Keep-alive timeout in seconds; keep above the load balancer's idle timeout")
+    parser.add_argument('--graceful-timeout', type=int, default=30,
+                        help="Seconds to drain in-flight requests after SIGTERM")
+    parser.add_argument('--limit-concurrency', type=int, default=None,
+                        help="Maximum concurrent connections per worker before 503s")
+    parser.add_argument('--no-access-log', dest='access_log', action='store_false',
+                        help="Disable per-request access logging (saves CPU under load)")
+    parser.add_argument('--reload', action='store_true', help="Development mode (single worker)")
+    parser.add_argument('--print-config', action='store_true',
+                        help="Print the effective configuration and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    config = build_config(args)
+    print_config(args.app, config)
+    if args.print_config:
+        return
+
+    import uvicorn
+    uvicorn.run(args.app, **config)
+
+
+if __name__ == '__main__':
+    main()
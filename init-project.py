@@ -5,8 +5,9 @@ Customizes the template for a new project by replacing placeholders
 """
 import sys
 import json
-import re
+import argparse
 import subprocess
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 
@@ -19,6 +20,20 @@ except ImportError:
     import questionary
     import yaml
 
+from placeholder_engine import (MANIFEST_FILE, Journal, ReplacementEngine, Rule, load_manifest,
+                                stale_files, summarize, write_manifest)
+
+CONTEXT_FILE = Path(".claude/context/project-context.yaml")
+
+# Backups of files touched by an in-progress run; present only if a run was interrupted
+JOURNAL_DIR = Path(".claude/context/.init-journal")
+
+# Values the placeholders hold in a fresh template
+TEMPLATE_PLACEHOLDERS = {
+    "name": "Claude Code Project Template",
+    "description": "Production-ready agent orchestration infrastructure for any project",
+}
+
 # Color formatting
 class Colors:
     HEADER = '\033[95m'
@@ -173,8 +188,8 @@ def get_project_info():
         }
     }
 
-def update_package_json(project_info):
-    """Update package.json with project details"""
+def update_package_json(project_info, previous, journal):
+    """Update package.json with project details (written only if a field changes)"""
     package_json_path = Path("package.json")
 
     if not package_json_path.exists():
@@ -183,6 +198,7 @@ def update_package_json(project_info):
 
     with open(package_json_path, 'r') as f:
         package_data = json.load(f)
+    original = json.loads(json.dumps(package_data))
 
     # Update package.json fields
     package_data["name"] = project_info["project"]["slug"]
@@ -196,130 +212,171 @@ def update_package_json(project_info):
             "url": project_info["project"]["repository"]
         }
 
-    with open(package_json_path, 'w') as f:
-        json.dump(package_data, f, indent=2)
-
-    print_success(f"Updated package.json → {project_info['project']['slug']}")
-
-def update_layout_tsx(project_info):
-    """Update app/layout.tsx with project name"""
-    layout_path = Path("app/layout.tsx")
-
-    if not layout_path.exists():
+    if package_data == original:
+        print_success("package.json unchanged")
         return
 
-    content = layout_path.read_text()
-
-    # Replace title and description
-    content = re.sub(
-        r"title: '[^']*'",
-        f"title: '{project_info['project']['name']}'",
-        content
-    )
-    content = re.sub(
-        r"description: '[^']*'",
-        f"description: '{project_info['project']['description']}'",
-        content
-    )
-
-    layout_path.write_text(content)
-    print_success(f"Updated app/layout.tsx → {project_info['project']['name']}")
-
-def update_home_page(project_info):
-    """Update app/page.tsx with project name"""
-    page_path = Path("app/page.tsx")
-
-    if not page_path.exists():
-        return
-
-    content = page_path.read_text()
-
-    # Replace project name
-    content = content.replace(
-        "Claude Code Project Template",
-        project_info['project']['name']
-    )
-
-    page_path.write_text(content)
-    print_success(f"Updated app/page.tsx → {project_info['project']['name']}")
-
-def update_fastapi_main(project_info):
-    """Update main.py with project details"""
-    main_path = Path("main.py")
+    journal.write(package_json_path, json.dumps(package_data, indent=2))
+    print_success(f"Updated package.json → {project_info['project']['slug']}")
 
-    if not main_path.exists():
-        return
+def placeholder_values(project_info):
+    """Current placeholder values: from the stored context, or the template's own"""
+    if not project_info:
+        return dict(TEMPLATE_PLACEHOLDERS)
+    return {
+        "name": project_info["project"]["name"],
+        "description": project_info["project"]["description"],
+    }
 
-    content = main_path.read_text()
-
-    # Replace title and description
-    content = re.sub(
-        r'title="[^"]*"',
-        f'title="{project_info["project"]["name"]} API"',
-        content
-    )
-    content = re.sub(
-        r'description="[^"]*"',
-        f'description="{project_info["project"]["description"]}"',
-        content
-    )
-    content = content.replace(
-        'FastAPI Backend for Claude Code Project Template',
-        f'FastAPI Backend for {project_info["project"]["name"]}'
-    )
-    content = content.replace(
-        '"message": "Claude Code Project Template API"',
-        f'"message": "{project_info["project"]["name"]} API"'
-    )
-
-    main_path.write_text(content)
-    print_success(f"Updated main.py → {project_info['project']['name']} API")
-
-def create_project_context(project_info):
+def placeholder_rules(project_info, previous=None):
+    """Placeholders (as left by the previous run, if any) and the files they apply to"""
+    name = project_info['project']['name']
+    description = project_info['project']['description']
+    old = placeholder_values(previous)
+    return [
+        # Next.js metadata
+        Rule("layout-title", r"title: '[^'\n]*'", f"title: '{name}'", ["app/layout.tsx"]),
+        Rule("layout-description", r"description: '[^'\n]*'", f"description: '{description}'", ["app/layout.tsx"]),
+        # FastAPI app (main.py); the specific phrases come before the generic name
+        Rule("api-title", r'title="[^"\n]*"', f'title="{name} API"', ["main.py"]),
+        Rule("api-description", r'description="[^"\n]*"', f'description="{description}"', ["main.py"]),
+        Rule("api-docstring", f"FastAPI Backend for {old['name']}",
+             f"FastAPI Backend for {name}", ["main.py"], literal=True),
+        Rule("api-message", f'"message": "{old["name"]} API"',
+             f'"message": "{name} API"', ["main.py"], literal=True),
+        # README title (the whole heading line, so "# Home" leaves "# Homepage" alone) and tagline
+        Rule("readme-title", f"# {old['name']}", f"# {name}", ["README.md"],
+             literal=True, max_count=1, line=True),
+        Rule("readme-description", f"> **{old['description']}**",
+             f"> **{description}**", ["README.md"], literal=True),
+        # Project name in frontend pages and components: only where the template puts it, a line
+        # of its own, so a short previous name ("App", "Home") leaves code and other text alone
+        Rule("project-name", old['name'], name,
+             ["app/*.tsx", "app/*.ts", "app/*.jsx", "components/*.tsx"], literal=True, line=True),
+    ]
+
+def customize_tree(project_info, previous, journal):
+    """Apply every placeholder rule across the tree in one pass per file"""
+    if previous and placeholder_values(previous) == placeholder_values(project_info):
+        print_success("Placeholders unchanged (no files scanned)")
+        return []
+
+    engine = ReplacementEngine(placeholder_rules(project_info, previous), journal=journal)
+    # A fresh template is patched from the precomputed manifest; re-inits scan for the previous values
+    manifest = None if previous else load_manifest(Path(MANIFEST_FILE), engine.rules)
+    if manifest:
+        results = engine.run_manifest(manifest)
+        stale = [result['path'] for result in results if result.get('stale')]
+        print_info(f"Applied {sum(len(r['matches']) for r in results)} indexed placeholders from {MANIFEST_FILE}"
+                   + (f" (re-scanned {len(stale)} changed files)" if stale else ""))
+    else:
+        results = engine.run()
+    for result in results:
+        if result['changed']:
+            rules = sorted({match['rule'] for match in result['matches']})
+            print_success(f"Updated {result['path']} ({', '.join(rules)})")
+        elif result.get('skipped'):
+            print_info(f"Skipped {result['path']}: {result['skipped']}")
+
+    matched = summarize(results)
+    unmatched = [rule.name for rule in engine.rules if rule.name not in matched]
+    if unmatched:
+        print_info(f"No matches for: {', '.join(unmatched)}")
+    return results
+
+def create_project_context(project_info, previous, journal):
     """Create .claude/context/project-context.yaml"""
-    context_dir = Path(".claude/context")
-    context_dir.mkdir(parents=True, exist_ok=True)
-
-    context_path = context_dir / "project-context.yaml"
-
-    with open(context_path, 'w') as f:
-        yaml.dump(project_info, f, default_flow_style=False, sort_keys=False)
-
-    print_success(f"Created .claude/context/project-context.yaml")
-
-def update_readme(project_info):
-    """Update README.md with project name"""
-    readme_path = Path("README.md")
-
-    if not readme_path.exists():
+    content = yaml.dump(project_info, default_flow_style=False, sort_keys=False)
+    if CONTEXT_FILE.exists() and CONTEXT_FILE.read_text() == content:
+        print_success(".claude/context/project-context.yaml unchanged")
         return
 
-    content = readme_path.read_text()
+    journal.write(CONTEXT_FILE, content)
+    print_success(f"{'Updated' if previous else 'Created'} .claude/context/project-context.yaml")
+
+def template_rules():
+    """Placeholder rules as they match a fresh template (what the manifest indexes)"""
+    return placeholder_rules({"project": dict(TEMPLATE_PLACEHOLDERS)})
+
+def build_manifest():
+    """Index every placeholder occurrence in the template into MANIFEST_FILE"""
+    manifest = ReplacementEngine(template_rules()).build_manifest()
+    write_manifest(Path(MANIFEST_FILE), manifest)
+    occurrences = sum(len(entry['occurrences']) for entry in manifest['files'].values())
+    print_success(f"Indexed {occurrences} placeholders in {len(manifest['files'])} files "
+                  f"and {len(manifest['templates'])} templates → {MANIFEST_FILE}")
+
+def check_manifest() -> bool:
+    """True if MANIFEST_FILE exists, matches the rules and indexes every file as it is now"""
+    engine = ReplacementEngine(template_rules())
+    manifest = load_manifest(Path(MANIFEST_FILE), engine.rules)
+    if manifest is None:
+        print_error(f"{MANIFEST_FILE} missing or built for different rules (run --build-manifest)")
+        return False
+    stale = stale_files(manifest)
+    unindexed = sorted(set(engine.discover()) - set(manifest['files']))
+    templates = [rel for rel in engine.walk() if rel.endswith('.j2')]
+    for rel in stale:
+        print_error(f"Changed since indexing: {rel}")
+    for rel in unindexed:
+        print_error(f"Not indexed: {rel}")
+    if templates != manifest['templates']:
+        print_error("Template list (*.j2) changed since indexing")
+    if stale or unindexed or templates != manifest['templates']:
+        print_info("Run: python init-project.py --build-manifest")
+        return False
+    print_success(f"{MANIFEST_FILE} is up to date")
+    return True
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Customize the template for a new project")
+    parser.add_argument('--profile', nargs='?', type=Path, const=Path('init-profile.json'), default=None,
+                        metavar='REPORT',
+                        help="Time each step (wall, CPU, bytes written, subprocesses) and write a JSON report "
+                             "(default: init-profile.json)")
+    parser.add_argument('--cprofile', type=Path, metavar='DIR',
+                        help="With --profile, also dump a cProfile .prof file per step into DIR")
+    parser.add_argument('--build-manifest', action='store_true',
+                        help=f"Index template placeholders into {MANIFEST_FILE} and exit")
+    parser.add_argument('--check-manifest', action='store_true',
+                        help=f"Exit non-zero if {MANIFEST_FILE} is stale")
+    return parser.parse_args(argv)
 
-    # Replace project name in title
-    content = re.sub(
-        r"# Claude Code Project Template",
-        f"# {project_info['project']['name']}",
-        content,
-        count=1
-    )
+def main():
+    """Main wizard flow"""
+    args = parse_args()
+    if args.build_manifest:
+        build_manifest()
+        return
+    if args.check_manifest:
+        sys.exit(0 if check_manifest() else 1)
 
-    # Update description
-    content = re.sub(
-        r"> \*\*Production-ready agent orchestration infrastructure for any project\*\*",
-        f"> **{project_info['project']['description']}**",
-        content
-    )
+    profiler = None
+    if args.profile:
+        from setup_profiler import PhaseProfiler
+        profiler = PhaseProfiler('init-project', cprofile_dir=args.cprofile)
 
-    readme_path.write_text(content)
-    print_success(f"Updated README.md → {project_info['project']['name']}")
+    def phase(name):
+        return profiler.phase(name) if profiler else nullcontext()
 
-def main():
-    """Main wizard flow"""
     try:
+        run_wizard(phase)
+    finally:
+        if profiler is not None:
+            report = profiler.write_report(args.profile)
+            profiler.print_summary()
+            print(f"\nSlowest step: {report['slowest_phase']} — report written to {args.profile}")
+
+def run_wizard(phase):
+    """Prompts, then each customization step inside `phase(name)`"""
+    try:
+        journal = Journal(JOURNAL_DIR)
+        if journal.pending:
+            print_info(f"Previous initialization was interrupted; restored {journal.rollback()} files")
+
         # Check if already initialized
-        context_file = Path(".claude/context/project-context.yaml")
-        if context_file.exists():
+        previous = None
+        if CONTEXT_FILE.exists():
             overwrite = questionary.confirm(
                 "⚠️  Project already initialized. Overwrite?",
                 default=False
@@ -327,9 +384,15 @@ def main():
             if not overwrite:
                 print_info("Initialization cancelled.")
                 return
+            with open(CONTEXT_FILE, 'r') as f:
+                previous = yaml.safe_load(f) or None
 
         # Collect project info
-        project_info = get_project_info()
+        with phase("get_project_info"):
+            project_info = get_project_info()
+        if previous:
+            # Keep the original creation time so an unchanged re-init writes nothing
+            project_info["project"]["created"] = previous.get("project", {}).get("created", project_info["project"]["created"])
 
         # Show summary
         print_header("📋 Project Configuration Summary")
@@ -347,12 +410,18 @@ def main():
         # Apply changes
         print_header("🔧 Customizing Template")
 
-        update_package_json(project_info)
-        update_layout_tsx(project_info)
-        update_home_page(project_info)
-        update_fastapi_main(project_info)
-        create_project_context(project_info)
-        update_readme(project_info)
+        # Every write is atomic and journaled; any failure restores the files touched so far
+        try:
+            for step in (update_package_json, customize_tree, create_project_context):
+                with phase(step.__name__):
+                    step(project_info, previous, journal)
+        except BaseException:
+            print_error(f"Initialization failed; restored {journal.rollback()} files")
+            raise
+        changed = len(journal.entries)
+        journal.commit()
+        if not changed:
+            print_success("Already up to date - no files changed")
 
         # Success message
         print_header("🎉 Initialization Complete!")
@@ -360,7 +429,7 @@ def main():
         print_info("\n📚 Next Steps:")
         print(f"   1. Run: {Colors.BOLD}./setup.sh{Colors.END} (install dependencies)")
         print(f"   2. Start frontend: {Colors.BOLD}npm run dev{Colors.END}")
-        print(f"   3. Start backend: {Colors.BOLD}uvicorn main:app --reload{Colors.END}")
+        print(f"   3. Start backend: {Colors.BOLD}uvicorn main:app --reload{Colors.END} (production: {Colors.BOLD}python -m backend.serve{Colors.END})")
         print(f"   4. Visit: {Colors.BOLD}http://localhost:3000{Colors.END}")
         print(f"\n   All 15 AI agents now know about '{project_info['project']['name']}'! 🚀\n")
 
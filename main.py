@@ -1,47 +1,293 @@
 """
 FastAPI Backend for Claude Code Project Template
+
+Build the app with create_app() (`uvicorn --factory main:create_app`);
+`main:app` is created lazily on first access for `uvicorn main:app`.
 """
-from fastapi import FastAPI
+from backend.startup import StartupTimer
+
+import_timer = StartupTimer()
+
+import json
+import os
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 
-app = FastAPI(
-    title="Claude Code Project Template API",
-    description="Production-ready FastAPI backend with Next.js frontend integration",
-    version="1.0.0"
-)
-
-# CORS configuration for Next.js frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],  # Next.js dev server
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "message": "Claude Code Project Template API",
-        "status": "running",
-        "docs": "/docs"
-    }
+from backend.admission import CRITICAL, SHEDDABLE, AdmissionController, AdmissionMiddleware
+from backend.cache import ResponseCache, ResponseCacheMiddleware
+from backend.coalesce import SingleFlight
+from backend.compression import CompressionMiddleware, CompressionStats
+from backend.health import HealthMonitor, disk_probe, url_probes
+from backend.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, MetricsRegistry
+from backend.serialization import FastJSONResponse, PreEncodedJSONResponse, pre_encode
 
-@app.get("/health")
-async def health():
-    """Health check endpoint"""
-    return {
-        "status": "ok",
-        "message": "FastAPI backend is running",
-        "timestamp": datetime.now().isoformat()
-    }
+import_timer.mark("imports")
+
+BATCH_LIMIT = 10000
 
-@app.get("/api/hello")
-async def hello(name: str = "World"):
-    """Example API endpoint"""
+def greeting(name: str) -> dict:
+    """Greeting payload shared by /api/hello and /api/hello/batch"""
     return {
         "message": f"Hello, {name}!",
         "timestamp": datetime.now().isoformat()
     }
+
+async def batch_greetings(names):
+    """Greet each name from an async stream; bad items become error lines"""
+    index = 0
+    try:
+        async for item in names:
+            if index >= BATCH_LIMIT:
+                yield {"error": f"batch limit of {BATCH_LIMIT} names exceeded", "index": index}
+                return
+            name = item.get("name") if isinstance(item, dict) else item
+            if isinstance(name, str):
+                yield greeting(name)
+            else:
+                yield {"error": "name must be a string", "index": index}
+            index += 1
+    except ValueError as e:
+        yield {"error": f"invalid NDJSON: {e}", "index": index}
+
+async def database(request: Request):
+    """Pooled database connection for one request"""
+    from backend.resources import PoolTimeout, PoolUnavailable
+    try:
+        async with request.app.state.resources.get("database").acquire() as connection:
+            yield connection
+    except PoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except PoolTimeout as e:
+        # Saturated pool: back-pressure like load shedding, not a server error
+        retry_after = str(request.app.state.admission.retry_after)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": retry_after})
+
+def create_app() -> FastAPI:
+    """Build the FastAPI app; optional features import their modules on first use"""
+    timer = StartupTimer()
+    timer.phases.update(import_timer.phases)
+
+    with timer.phase("components"):
+        # Readiness probes run in the background; /health/ready serves the last result
+        health_monitor = HealthMonitor()
+        health_monitor.register("disk", disk_probe("."), interval=30.0)
+        for probe_name, probe in url_probes(os.environ):
+            health_monitor.register(probe_name, probe, interval=10.0)
+
+        # Load shedding: 503 + Retry-After past the concurrency or event-loop lag target
+        admission = AdmissionController(
+            max_concurrency=int(os.environ.get("ADMISSION_MAX_CONCURRENCY", 512)),
+            target_lag=float(os.environ.get("ADMISSION_TARGET_LAG_MS", 100)) / 1000,
+            max_streams=int(os.environ.get("ADMISSION_MAX_STREAMS", 1000)),
+        )
+        admission.set_priority(["/health", "/health/live", "/health/ready", "/metrics"], CRITICAL)
+        admission.set_priority(["/api/hello/batch"], SHEDDABLE)
+        admission.set_streaming(["/api/board/stream"])
+
+        # Identical concurrent requests to @singleflight.coalesce() routes share one computation
+        singleflight = SingleFlight()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        with timer.phase("lifespan"):
+            # Connection pools shared across requests; SQLite stands in when DATABASE_URL is unset
+            from backend.resources import ResourceRegistry, pool_from_url
+            resources = ResourceRegistry()
+            resources.register(pool_from_url("database", os.environ.get("DATABASE_URL", "sqlite:///:memory:")))
+            if os.environ.get("REDIS_URL"):
+                resources.register(pool_from_url("cache", os.environ["REDIS_URL"]))
+            await resources.startup()
+            app.state.resources = resources
+
+            await health_monitor.start()
+            await admission.lag_monitor.start()
+        app.state.startup_report = timer.report()
+        yield
+        board_watcher = getattr(app.state, "board_watcher", None)
+        if board_watcher is not None:
+            await board_watcher.stop()
+        await admission.lag_monitor.stop()
+        await health_monitor.stop()
+        await resources.shutdown()
+
+    with timer.phase("app"):
+        app = FastAPI(
+            title="Claude Code Project Template API",
+            description="Production-ready FastAPI backend with Next.js frontend integration",
+            version="1.0.0",
+            lifespan=lifespan,
+            default_response_class=FastJSONResponse
+        )
+
+    with timer.phase("middleware"):
+        # Response cache: path -> TTL in seconds (keyed on path + query, e.g. ?name=)
+        # Registered before CORS so CORS headers are applied per request, not cached
+        cache_ttls = {
+            "/": 300,
+            "/api/hello": 1,
+        }
+        response_cache = ResponseCache(max_entries=4096)
+        app.add_middleware(ResponseCacheMiddleware, routes=cache_ttls, cache=response_cache)
+
+        # gzip/brotli above 1 KiB; long-lived cached responses are compressed once at a high level
+        compression_stats = CompressionStats()
+        app.add_middleware(CompressionMiddleware, minimum_size=1024, stats=compression_stats,
+                           precompress_paths=[path for path, ttl in cache_ttls.items() if ttl >= 60])
+
+        # Rejects early, before compression/cache do any work; inside CORS so browsers
+        # can read the 503 and its Retry-After
+        app.add_middleware(AdmissionMiddleware, controller=admission)
+
+        # CORS configuration for Next.js frontend
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["http://localhost:3000"],  # Next.js dev server
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["Retry-After"],
+        )
+
+        # Request metrics (outermost, so cache hits, shed requests and CORS preflights are counted)
+        metrics = MetricsRegistry()
+        metrics.add_collector(response_cache.collect)
+        metrics.add_collector(health_monitor.collect)
+        metrics.add_collector(compression_stats.collect)
+        metrics.add_collector(singleflight.collect)
+        metrics.add_collector(admission.collect)
+        metrics.add_collector(timer.collect)
+
+        # Registered once here: the lifespan (and its pools) can run more than once per app
+        def resources_collect():
+            resources = getattr(app.state, "resources", None)
+            return resources.collect() if resources is not None else []
+        metrics.add_collector(resources_collect)
+        app.add_middleware(MetricsMiddleware, registry=metrics)
+
+        app.state.response_cache = response_cache
+        app.state.metrics = metrics
+        app.state.health_monitor = health_monitor
+        app.state.admission = admission
+        app.state.singleflight = singleflight
+
+    with timer.phase("routes"):
+        # Static payloads are encoded once at startup
+        root_body = pre_encode({
+            "message": "Claude Code Project Template API",
+            "status": "running",
+            "docs": "/docs"
+        })
+        live_body = pre_encode({"status": "alive"})
+
+        @app.get("/")
+        async def root():
+            """Root endpoint"""
+            return PreEncodedJSONResponse(root_body)
+
+        @app.get("/health")
+        async def health():
+            """Health check endpoint"""
+            return FastJSONResponse({
+                "status": "ok",
+                "message": "FastAPI backend is running",
+                "timestamp": datetime.now().isoformat()
+            })
+
+        @app.get("/health/live")
+        async def health_live():
+            """Liveness probe: the process is up and serving requests"""
+            return PreEncodedJSONResponse(live_body)
+
+        @app.get("/health/ready")
+        async def health_ready():
+            """Readiness probe: cached results of the background dependency checks"""
+            report = health_monitor.readiness()
+            return FastJSONResponse(report, status_code=200 if report["status"] == "ready" else 503)
+
+        # Coalesced callers share the encoded body; each request still gets its own Response
+        @singleflight.coalesce()
+        async def greeting_body(name: str) -> bytes:
+            return pre_encode(greeting(name))
+
+        @app.get("/api/hello")
+        async def hello(name: str = "World"):
+            """Example API endpoint"""
+            return PreEncodedJSONResponse(await greeting_body(name=name))
+
+        @app.post("/api/hello/batch")
+        async def hello_batch(request: Request):
+            """Batch greetings: JSON array or NDJSON body in, NDJSON stream out"""
+            from backend.ndjson import NDJSONStreamingResponse, encode_ndjson, iter_items, iter_ndjson
+
+            if "ndjson" in request.headers.get("content-type", ""):
+                names = iter_ndjson(request.stream())
+            else:
+                try:
+                    payload = json.loads(await request.body())
+                except ValueError:
+                    raise HTTPException(status_code=400, detail="Body must be a JSON array of names")
+                if isinstance(payload, dict):
+                    payload = payload.get("names")
+                if not isinstance(payload, list):
+                    raise HTTPException(status_code=400, detail="Body must be a JSON array of names")
+                if len(payload) > BATCH_LIMIT:
+                    raise HTTPException(status_code=413, detail=f"Batch limit is {BATCH_LIMIT} names")
+                names = iter_items(payload)
+
+            return NDJSONStreamingResponse(encode_ndjson(batch_greetings(names)))
+
+        @app.get("/api/cache/stats")
+        async def cache_stats():
+            """Response cache hit/miss counters"""
+            return response_cache.stats()
+
+        @app.get("/api/board/stream")
+        async def board_stream():
+            """Server-Sent Events: board snapshot, then per-task deltas as agents update it"""
+            from fastapi.responses import StreamingResponse
+            from backend.board import BoardWatcher, sse_stream
+
+            # One watcher serves every board subscriber (polls a single stat() per interval)
+            board_watcher = getattr(app.state, "board_watcher", None)
+            if board_watcher is None:
+                board_watcher = BoardWatcher(os.environ.get("BOARD_PATH", "AGENT_COMMUNICATION_BOARD.md"))
+                app.state.board_watcher = board_watcher
+            try:
+                queue = await board_watcher.subscribe()
+            except OverflowError as e:
+                raise HTTPException(status_code=503, detail=str(e))
+            return StreamingResponse(
+                sse_stream(board_watcher, queue),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
+        @app.get("/api/db/ping")
+        async def db_ping(request: Request, db=Depends(database)):
+            """Example of a route using the shared database pool"""
+            await db.fetchone("SELECT 1")
+            return {"database": "ok", "pool": request.app.state.resources.get("database").stats()}
+
+        @app.get("/api/startup")
+        async def startup_report():
+            """Cold-start timing per phase (imports, app, middleware, routes, lifespan)"""
+            return app.state.startup_report
+
+        @app.get("/metrics")
+        async def prometheus_metrics():
+            """Prometheus metrics endpoint"""
+            return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    app.state.startup_report = timer.report()
+    return app
+
+def __getattr__(name):
+    # `uvicorn main:app` and `from main import app` build the app on first access
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
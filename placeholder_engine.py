@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Placeholder Replacement Engine
+Applies every placeholder rule for a file in one regex pass, across the whole tree in parallel
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import fnmatch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Directories never scanned for placeholders
+SKIP_DIRS = {'.git', '.cache', '.next', 'node_modules', 'venv', '.venv', '__pycache__'}
+
+# Files above this size are rewritten line by line instead of being read whole
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Precomputed index of placeholder occurrences, shipped at the template root
+MANIFEST_FILE = '.placeholder-manifest.json'
+MANIFEST_VERSION = 1
+
+def content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+def atomic_write(path: Path, content: str):
+    """Write via a temp file + rename, so readers and file watchers only ever see the whole file"""
+    tmp_path = path.with_name(f'.{path.name}.write-tmp')
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+    if path.exists():
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
+class Journal:
+    """Backs up every file before a run first modifies it, so a failed run can be rolled back
+
+    The journal directory holds journal.json ([{path, backup}], backup is null for files
+    the run created) and the backup copies; it is removed on commit() or rollback(),
+    so its presence at startup means the previous run was interrupted.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.index_path = self.directory / 'journal.json'
+        self.entries: List[dict] = []
+        self.lock = threading.Lock()
+
+    @property
+    def pending(self) -> bool:
+        return self.index_path.exists()
+
+    def record(self, path: Path):
+        path = Path(path).resolve()
+        with self.lock:
+            if any(entry['path'] == str(path) for entry in self.entries):
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            backup = None
+            if path.exists():
+                backup = self.directory / f"{len(self.entries):04d}-{path.name}"
+                shutil.copy2(path, backup)
+            self.entries.append({'path': str(path), 'backup': str(backup) if backup else None})
+            atomic_write(self.index_path, json.dumps(self.entries, indent=2))
+
+    def write(self, path: Path, content: str):
+        self.record(path)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(Path(path), content)
+
+    def rollback(self) -> int:
+        """Restore every recorded file (newest first); returns how many were restored"""
+        if not self.entries and self.pending:
+            with open(self.index_path, 'r') as f:
+                self.entries = json.load(f)
+        for entry in reversed(self.entries):
+            path = Path(entry['path'])
+            if entry['backup']:
+                tmp_path = path.with_name(f'.{path.name}.rollback-tmp')
+                shutil.copy2(entry['backup'], tmp_path)
+                os.replace(tmp_path, path)
+            elif path.exists():
+                path.unlink()
+        restored = len(self.entries)
+        self.commit()
+        return restored
+
+    def commit(self):
+        self.entries = []
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+class Rule:
+    """One placeholder: a single-line regex (or literal), its replacement and the files it applies to
+
+    Patterns must not span lines (so large files can be streamed) and must not use
+    named groups; `max_count` limits replacements per file (e.g. only the first heading).
+    With `line`, the pattern must make up a whole line apart from its indentation,
+    which is kept.
+    """
+    __slots__ = ('name', 'pattern', 'replacement', 'files', 'max_count', 'line')
+
+    def __init__(self, name: str, pattern: str, replacement: str, files: Iterable[str],
+                 literal: bool = False, max_count: Optional[int] = None, line: bool = False):
+        self.name = name
+        self.pattern = re.escape(pattern) if literal else pattern
+        if line:
+            self.pattern = rf'^[ \t]*(?:{self.pattern})(?=[ \t]*\r?$)'
+        self.replacement = replacement
+        self.files = tuple(files)
+        self.max_count = max_count
+        self.line = line
+
+    def replace(self, matched: str) -> str:
+        """Replacement for one match (a line rule keeps the matched line's indentation)"""
+        if self.line:
+            return matched[:len(matched) - len(matched.lstrip(' \t'))] + self.replacement
+        return self.replacement
+
+    def applies_to(self, rel_path: str) -> bool:
+        return any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.files)
+
+def rules_fingerprint(rules: List[Rule]) -> str:
+    """Identifies the rule patterns (not their replacements) a manifest was built with"""
+    spec = [[rule.name, rule.pattern, list(rule.files), rule.max_count] for rule in rules]
+    return content_digest(json.dumps(spec).encode('utf-8'))
+
+@lru_cache(maxsize=None)
+def compile_matcher(patterns: Tuple[str, ...]) -> 're.Pattern':
+    """One alternation over the given rule patterns; group r<i> identifies the rule that matched"""
+    return re.compile('|'.join(f'(?P<r{i}>{pattern})' for i, pattern in enumerate(patterns)), re.MULTILINE)
+
+class ReplacementEngine:
+    def __init__(self, rules: List[Rule], root: Path = Path('.'), workers: Optional[int] = None,
+                 stream_threshold: int = STREAM_THRESHOLD, journal: Optional[Journal] = None):
+        self.rules = rules
+        self.journal = journal
+        self.root = Path(root)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.stream_threshold = stream_threshold
+
+    def rules_for(self, rel_path: str) -> Tuple[Rule, ...]:
+        return tuple(rule for rule in self.rules if rule.applies_to(rel_path))
+
+    def walk(self) -> Iterable[str]:
+        """Relative paths (posix) of every file in the tree outside SKIP_DIRS"""
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                yield Path(dirpath, filename).relative_to(self.root).as_posix()
+
+    def discover(self) -> List[str]:
+        """Relative paths of every file at least one rule applies to"""
+        return [rel_path for rel_path in self.walk() if self.rules_for(rel_path)]
+
+    def substitute(self, rules: Tuple[Rule, ...], text: str, line: int, counts: Dict[str, int],
+                   matches: List[dict], offset: int = 0) -> str:
+        """Apply all rules to text in one pass; records {rule, line, offset} per replacement"""
+        matcher = compile_matcher(tuple(rule.pattern for rule in rules))
+        position = [0, line]
+
+        def replace(match):
+            rule = rules[int(match.lastgroup[1:])]
+            # Line numbers are counted incrementally between matches
+            position[1] += text.count('\n', position[0], match.start())
+            position[0] = match.start()
+            if rule.max_count is not None and counts.get(rule.name, 0) >= rule.max_count:
+                # Used up: the remaining rules still get a chance at this text
+                remaining = tuple(other for other in rules if other is not rule)
+                if not remaining:
+                    return match.group(0)
+                return self.substitute(remaining, match.group(0), position[1], counts, matches,
+                                       offset + match.start())
+            counts[rule.name] = counts.get(rule.name, 0) + 1
+            matches.append({'rule': rule.name, 'line': position[1], 'offset': offset + match.start(),
+                            'length': match.end() - match.start()})
+            return rule.replace(match.group(0))
+
+        return matcher.sub(replace, text)
+
+    def process_file(self, rel_path: str) -> dict:
+        """Rewrite one file if any rule changes it; returns {path, changed, matches}"""
+        path = self.root / rel_path
+        rules = self.rules_for(rel_path)
+        matches: List[dict] = []
+        counts: Dict[str, int] = {}
+        result = {'path': rel_path, 'changed': False, 'matches': matches}
+        try:
+            if path.stat().st_size > self.stream_threshold:
+                result['changed'] = self.process_stream(path, rules, counts, matches)
+                return result
+            original = path.read_text(encoding='utf-8')
+        except UnicodeDecodeError:
+            result['skipped'] = 'not UTF-8 text'
+            return result
+        content = self.substitute(rules, original, 1, counts, matches)
+        if content != original:
+            self.write(path, content)
+            result['changed'] = True
+        return result
+
+    def process_stream(self, path: Path, rules: Tuple[Rule, ...], counts: Dict[str, int],
+                       matches: List[dict]) -> bool:
+        """Line-by-line rewrite into a temp file; the original is replaced only if something changed"""
+        tmp_path = path.with_name(f'.{path.name}.replace-tmp')
+        changed = False
+        offset = 0
+        try:
+            with open(path, 'r', encoding='utf-8', newline='') as src, \
+                    open(tmp_path, 'w', encoding='utf-8', newline='') as dst:
+                for line_number, line in enumerate(src, 1):
+                    new_line = self.substitute(rules, line, line_number, counts, matches, offset)
+                    changed = changed or new_line != line
+                    offset += len(line)
+                    dst.write(new_line)
+            if changed:
+                if self.journal:
+                    self.journal.record(path)
+                shutil.copymode(path, tmp_path)
+                os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return changed
+
+    def write(self, path: Path, content: str):
+        if self.journal:
+            self.journal.write(path, content)
+        else:
+            atomic_write(path, content)
+
+    def run(self, paths: Optional[List[str]] = None) -> List[dict]:
+        """Process the given files (default: the whole tree) in parallel; results in path order"""
+        paths = self.discover() if paths is None else paths
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self.process_file, paths))
+
+    def scan(self, rel_path: str) -> dict:
+        """Manifest entry for one file: its digest and every occurrence, without rewriting it"""
+        data = (self.root / rel_path).read_bytes()
+        entry = {'digest': content_digest(data), 'occurrences': []}
+        if len(data) > self.stream_threshold:
+            # Large files are streamed at apply time rather than patched by offset
+            entry['stream'] = True
+            return entry
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['skipped'] = 'not UTF-8 text'
+            return entry
+        self.substitute(self.rules_for(rel_path), text, 1, {}, entry['occurrences'])
+        return entry
+
+    def build_manifest(self) -> dict:
+        """Index every placeholder occurrence (file, offset, rule) and every *.j2 template in the tree"""
+        paths, templates = [], []
+        for rel_path in self.walk():
+            if self.rules_for(rel_path):
+                paths.append(rel_path)
+            if rel_path.endswith('.j2'):
+                templates.append(rel_path)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            entries = list(pool.map(self.scan, paths))
+        return {
+            'version': MANIFEST_VERSION,
+            'rules': rules_fingerprint(self.rules),
+            'files': dict(zip(paths, entries)),
+            'templates': templates,
+        }
+
+    def patch_file(self, rel_path: str, entry: dict) -> dict:
+        """Apply indexed occurrences by offset; falls back to a full pass if the file changed since indexing"""
+        path = self.root / rel_path
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return {'path': rel_path, 'changed': False, 'matches': [], 'skipped': 'missing'}
+        if entry.get('stream') or entry.get('skipped') or content_digest(data) != entry['digest']:
+            result = self.process_file(rel_path)
+            result['stale'] = not entry.get('stream') and not entry.get('skipped')
+            return result
+
+        text = data.decode('utf-8')
+        rules = {rule.name: rule for rule in self.rules}
+        pieces = []
+        end = len(text)
+        for occurrence in reversed(entry['occurrences']):
+            rule = rules[occurrence['rule']]
+            start = occurrence['offset']
+            pieces.append(text[start + occurrence['length']:end])
+            pieces.append(rule.replace(text[start:start + occurrence['length']]))
+            end = start
+        pieces.append(text[:end])
+        content = ''.join(reversed(pieces))
+        result = {'path': rel_path, 'changed': False, 'matches': entry['occurrences'], 'stale': False}
+        if content != text:
+            self.write(path, content)
+            result['changed'] = True
+        return result
+
+    def run_manifest(self, manifest: dict) -> List[dict]:
+        """Targeted patches for every indexed file, in parallel; stale files are re-scanned"""
+        files = manifest['files']
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(lambda rel_path: self.patch_file(rel_path, files[rel_path]), sorted(files)))
+
+def load_manifest(path: Path, rules: List[Rule]) -> Optional[dict]:
+    """The manifest at path, or None if missing, unreadable or built for different rules"""
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('rules') != rules_fingerprint(rules):
+        return None
+    return manifest
+
+def write_manifest(path: Path, manifest: dict):
+    atomic_write(Path(path), json.dumps(manifest, indent=1, sort_keys=True) + '\n')
+
+def stale_files(manifest: dict, root: Path = Path('.')) -> List[str]:
+    """Indexed files whose content no longer matches the digest recorded at build time"""
+    stale = []
+    for rel_path, entry in sorted(manifest['files'].items()):
+        path = Path(root) / rel_path
+        if not path.exists() or content_digest(path.read_bytes()) != entry['digest']:
+            stale.append(rel_path)
+    return stale
+
+def summarize(results: List[dict]) -> Dict[str, List[str]]:
+    """{rule name: ["path:line", ...]} across all processed files"""
+    where: Dict[str, List[str]] = {}
+    for result in results:
+        for match in result['matches']:
+            where.setdefault(match['rule'], []).append(f"{result['path']}:{match['line']}")
+    return where
@@ -7,15 +7,24 @@ Bootstraps a new project with agents, structure enforcement, and memory system
 import os
 import sys
 import json
+import time
 import shutil
+import fnmatch
+import hashlib
+import argparse
+import traceback
+import importlib.util
+import inspect
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
 try:
     import yaml
-    from jinja2 import Template
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta
     import questionary
 except ImportError:
     print("❌ Missing required dependencies!")
@@ -46,11 +55,295 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.END}")
 
+# Template directories installed into a project (relative to both roots)
+TEMPLATE_DIRS = [f'.claude/{subdir}' for subdir in
+                 ['agents', 'docs', 'hooks', 'memory', 'scripts', 'structure', 'config']] + ['docs', 'tests']
+
+# Agent memory engine, installed with .claude/scripts (usable from the project afterwards)
+AGENT_MEMORY_SCRIPT = '.claude/scripts/agent_memory.py'
+
+# Digests of the template files as last installed, used to tell local edits from template updates
+SYNC_STATE_FILE = '.claude/.template-sync.json'
+
+# Directories never searched for *.j2 templates or copied by the template sync
+TEMPLATE_SKIP_DIRS = {'.git', '.cache', '.next', 'node_modules', 'venv', '.venv', '__pycache__'}
+
+# Bytecode, OS metadata and editor temp files inside the template dirs are never copied
+SYNC_IGNORED_FILES = ['*.pyc', '*.pyo', '.DS_Store', 'Thumbs.db', '.*.sw?', '.#*', '*~', '.*-tmp']
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b digest of a file's contents, read in 1 MiB chunks"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class TemplateSync:
+    """Incremental, content-hashed copy of the template tree into a project
+
+    Each file is classified against the digest recorded when it was last installed:
+      copied     - new in the project, or the template changed and the local copy did not
+      unchanged  - project copy already matches the template
+      modified   - edited locally and the template did not change (kept)
+      conflict   - edited locally and changed in the template (kept; new version
+                   written next to it as <name>.template-new)
+
+      adopted    - no baseline yet (project set up before sync state was recorded) and
+                   different from the template: replaced, previous content saved next
+                   to it as <name>.pre-sync
+
+    After the first sync every file has a baseline, so later local edits are kept.
+    """
+
+    def __init__(self, template_root: Path, project_root: Path, workers: Optional[int] = None):
+        self.template_root = template_root
+        self.project_root = project_root
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.state_path = project_root / SYNC_STATE_FILE
+        self.adopting = not self.state_path.exists()
+        self.state = self.load_state()
+        self.report = {'copied': [], 'unchanged': [], 'modified': [], 'conflict': [], 'adopted': [], 'bytes': 0}
+
+    def load_state(self) -> Dict[str, dict]:
+        """Recorded {relpath: {digest, size, mtime_ns}} from the previous sync"""
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f).get('files', {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'synced_at': datetime.now().isoformat(), 'files': self.state}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def source_files(self, dirs: List[str]) -> List[str]:
+        files = []
+        for rel_dir in dirs:
+            src_dir = self.template_root / rel_dir
+            for dirpath, dirnames, filenames in os.walk(src_dir):
+                dirnames[:] = sorted(d for d in dirnames if d not in TEMPLATE_SKIP_DIRS)
+                files.extend(Path(dirpath, filename).relative_to(self.template_root).as_posix()
+                             for filename in sorted(filenames)
+                             if not any(fnmatch.fnmatch(filename, pattern) for pattern in SYNC_IGNORED_FILES))
+        return files
+
+    def local_digest(self, rel: str, dst: Path) -> Optional[str]:
+        """Digest of the project copy; a stat match with the recorded entry skips the read"""
+        try:
+            st = dst.stat()
+        except FileNotFoundError:
+            return None
+        recorded = self.state.get(rel)
+        if recorded and recorded.get('size') == st.st_size and recorded.get('mtime_ns') == st.st_mtime_ns:
+            return recorded['digest']
+        return file_digest(dst)
+
+    def sync_file(self, rel: str) -> tuple:
+        src = self.template_root / rel
+        dst = self.project_root / rel
+        src_digest = file_digest(src)
+        dst_digest = self.local_digest(rel, dst)
+        installed = self.state.get(rel, {}).get('digest')
+
+        if dst_digest == src_digest:
+            return rel, 'unchanged', src_digest, 0
+        if installed is None and self.adopting and dst_digest is not None:
+            # No baseline to tell an old template version from local edits: keep a copy of either
+            self.copy(dst, dst.with_name(dst.name + '.pre-sync'))
+            return rel, 'adopted', src_digest, self.copy(src, dst)
+        if dst_digest is not None and dst_digest != installed:
+            if installed == src_digest:
+                return rel, 'modified', installed, 0
+            # Local edits (or a file we never installed) and a different template version: never overwrite
+            self.copy(src, dst.with_name(dst.name + '.template-new'))
+            return rel, 'conflict', installed, 0
+        return rel, 'copied', src_digest, self.copy(src, dst)
+
+    @staticmethod
+    def copy(src: Path, dst: Path) -> int:
+        """Copy via a temp file + rename so an interrupted sync never leaves a partial file"""
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dst.with_name(f'.{dst.name}.sync-tmp')
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+        return dst.stat().st_size
+
+    def run(self, dirs: List[str]) -> dict:
+        """Sync the given template directories; returns the per-status report"""
+        files = self.source_files(dirs)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self.sync_file, files))
+
+        for rel, status, digest, size in results:
+            self.report[status].append(rel)
+            self.report['bytes'] += size
+            dst = self.project_root / rel
+            if digest is not None and dst.exists():
+                st = dst.stat()
+                if status in ('copied', 'unchanged', 'adopted'):
+                    self.state[rel] = {'digest': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+                else:
+                    # Keep the installed digest so the local edit stays detectable
+                    self.state[rel] = {'digest': digest, 'size': None, 'mtime_ns': None}
+        self.save_state()
+        return self.report
+
+# Compiled-template cache and per-output input digests from the last render
+RENDER_CACHE_DIR = '.claude/.cache/jinja'
+RENDER_STATE_FILE = '.claude/.cache/render-state.json'
+
+# Config values that change on every run; left out of render digests, so they are only
+# refreshed when an output is re-rendered for another reason
+RENDER_VOLATILE = {'current_date'}
+
+_environments: Dict[tuple, Environment] = {}
+
+def template_environment(template_root: Path, project_root: Path) -> Environment:
+    """Shared Jinja2 environment; project copies of templates take precedence over the template's"""
+    key = (template_root, project_root)
+    if key not in _environments:
+        cache_dir = project_root / RENDER_CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _environments[key] = Environment(
+            loader=FileSystemLoader([str(project_root), str(template_root)]),
+            bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+        )
+    return _environments[key]
+
+# Index written by `python init-project.py --build-manifest`; lists the *.j2 templates
+PLACEHOLDER_MANIFEST = '.placeholder-manifest.json'
+
+def discover_templates(root: Path) -> List[str]:
+    """Relative paths of every *.j2 under root, skipping VCS, build and dependency directories
+
+    Uses the template's placeholder manifest when every template it lists still exists,
+    so no tree walk is needed.
+    """
+    try:
+        with open(root / PLACEHOLDER_MANIFEST, 'r') as f:
+            listed = json.load(f).get('templates')
+        if listed and all((root / rel).is_file() for rel in listed):
+            return listed
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in TEMPLATE_SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith('.j2'):
+                found.append(Path(dirpath, filename).relative_to(root).as_posix())
+    return found
+
+def load_render_state(project_root: Path) -> dict:
+    """{'setup_date': ..., 'templates': {name: digest}} from the last render"""
+    try:
+        with open(project_root / RENDER_STATE_FILE, 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    if 'templates' not in state:
+        # Older state files only held the digests
+        state = {'templates': state}
+    return state
+
+def render_digest(env: Environment, name: str, config: dict) -> str:
+    """Digest of a template's source plus only the (non-volatile) config values it references"""
+    source = env.loader.get_source(env, name)[0]
+    variables = sorted(meta.find_undeclared_variables(env.parse(source)) - RENDER_VOLATILE)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(source.encode('utf-8'))
+    digest.update(json.dumps({k: config.get(k) for k in variables}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+# Answers used by headless setup when the config file leaves them out (same as the interactive defaults)
+PROJECT_DEFAULTS = {
+    'project_description': "A production-ready application",
+    'admin_email': "admin@example.com",
+    'frontend_framework': "React",
+    'frontend_language': "TypeScript",
+    'backend_framework': "FastAPI",
+    'frontend_platform': "Vercel",
+    'backend_platform': "Railway",
+    'tier': "standard",
+}
+
+BACKEND_LANGUAGES = {
+    "FastAPI": "Python",
+    "Django": "Python",
+    "Flask": "Python",
+    "Express": "Node.js",
+    "NestJS": "Node.js",
+    "Go (Gin)": "Go"
+}
+
+TIER_FEATURES = {
+    'minimal': {
+        'enable_structure_enforcement': True,
+        'enable_memory_system': False,
+        'enable_reflection_system': False,
+        'enable_automated_cleanup': False,
+    },
+    'standard': {
+        'enable_structure_enforcement': True,
+        'enable_memory_system': True,
+        'enable_reflection_system': False,
+        'enable_automated_cleanup': False,
+    },
+    'complete': {
+        'enable_structure_enforcement': True,
+        'enable_memory_system': True,
+        'enable_reflection_system': True,
+        'enable_automated_cleanup': True,
+    },
+}
+
+def load_config_file(path: Path) -> dict:
+    """Setup answers from a YAML or JSON file"""
+    with open(path, 'r') as f:
+        if Path(path).suffix.lower() == '.json':
+            data = json.load(f)
+        else:
+            data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping of setup answers")
+    return data
+
+def format_bytes(size: int) -> str:
+    for unit in ['B', 'KiB', 'MiB']:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def supports_in_process(module) -> bool:
+    """Whether a loaded validate_setup.py has the SetupValidator(project_root=...) API"""
+    validator = getattr(module, 'SetupValidator', None)
+    if validator is None or not all(hasattr(validator, name) for name in ('run_all_checks', 'write_json', 'report')):
+        return False
+    try:
+        return 'project_root' in inspect.signature(validator).parameters
+    except (TypeError, ValueError):
+        return False
+
 class SetupWizard:
-    def __init__(self):
+    def __init__(self, sync: bool = False, project_root: Optional[Path] = None, answers: Optional[dict] = None,
+                 profiler=None):
         self.template_root = Path(__file__).parent.resolve()
-        self.project_root = Path.cwd()
+        self.project_root = Path(project_root or Path.cwd()).resolve()
         self.config = {}
+        # Headless mode: answers come from a config file instead of prompts
+        self.answers = answers
+        self.headless = answers is not None
+        self.sync = sync
+        self.sync_report = None
+        self.validation_report = None
+        # Optional setup_profiler.PhaseProfiler (--profile)
+        self.profiler = profiler
 
     def run(self):
         """Main setup flow"""
@@ -63,43 +356,32 @@ class SetupWizard:
         print("   • Quality gates & reflection")
         print()
 
-        # Check prerequisites
-        if not self.check_prerequisites():
-            return False
-
-        # Gather project information
-        if not self.gather_project_info():
-            return False
-
-        # Choose tier
-        if not self.choose_tier():
-            return False
-
-        # Copy template files based on tier
-        if not self.copy_template_files():
-            return False
-
-        # Render Jinja2 templates
-        if not self.render_templates():
-            return False
-
-        # Install git hooks
-        if not self.install_git_hooks():
-            return False
-
-        # Initialize memory system
-        if not self.initialize_memory():
-            return False
-
-        # Run validation
-        if not self.validate_setup():
-            return False
+        steps = [
+            ('check_prerequisites', self.check_prerequisites),
+            ('gather_project_info', self.gather_project_info),
+            ('choose_tier', self.choose_tier),
+            ('copy_template_files', self.copy_template_files),
+            ('render_templates', self.render_templates),
+            ('install_git_hooks', self.install_git_hooks),
+            ('initialize_memory', self.initialize_memory),
+            ('validate_setup', self.validate_setup),
+        ]
+        for name, step in steps:
+            if not self.run_phase(name, step):
+                return False
 
         # Show success message
         self.show_success_message()
 
         return True
 
+    def run_phase(self, name: str, step) -> bool:
+        """Run one setup step, timed when profiling"""
+        if self.profiler is None:
+            return step()
+        with self.profiler.phase(name):
+            return step()
+
     def check_prerequisites(self) -> bool:
         """Check Python version, git, etc."""
         print_header("Checking Prerequisites")
@@ -124,9 +406,12 @@ class SetupWizard:
             print_success("Git repository detected")
         except subprocess.CalledProcessError:
             print_warning("Not in a git repository")
-            init_git = questionary.confirm("Initialize git repository?").ask()
+            if self.headless:
+                init_git = self.answers.get('init_git', True)
+            else:
+                init_git = questionary.confirm("Initialize git repository?").ask()
             if init_git:
-                subprocess.run(['git', 'init'], cwd=self.project_root, check=True)
+                subprocess.run(['git', 'init'], cwd=self.project_root, check=True, capture_output=self.headless)
                 print_success("Git repository initialized")
             else:
                 print_warning("Proceeding without git (hooks will not work)")
@@ -134,9 +419,18 @@ class SetupWizard:
         return True
 
     def gather_project_info(self) -> bool:
-        """Gather project details from user"""
+        """Gather project details from user (or the config file in headless mode)"""
         print_header("Project Information")
 
+        if self.headless:
+            self.config.update(PROJECT_DEFAULTS)
+            self.config['project_name'] = self.project_root.name
+            self.config.update({k: v for k, v in self.answers.items() if k not in ('init_git', 'projects')})
+            self.config.setdefault('project_slug', self.config['project_name'].lower().replace(' ', '-'))
+            self.derive_config()
+            print_success(f"Loaded answers for {self.config['project_name']}")
+            return True
+
         # Project name
         default_name = self.project_root.name
         self.config['project_name'] = questionary.text(
@@ -181,20 +475,6 @@ class SetupWizard:
             choices=["FastAPI", "Express", "Django", "Flask", "NestJS", "Go (Gin)", "Other"]
         ).ask()
 
-        # Backend language
-        backend_lang_map = {
-            "FastAPI": "Python",
-            "Django": "Python",
-            "Flask": "Python",
-            "Express": "Node.js",
-            "NestJS": "Node.js",
-            "Go (Gin)": "Go"
-        }
-        self.config['backend_language'] = backend_lang_map.get(
-            self.config['backend_framework'],
-            "Python"
-        )
-
         # Frontend platform
         self.config['frontend_platform'] = questionary.select(
             "Frontend deployment platform?",
@@ -207,29 +487,48 @@ class SetupWizard:
             choices=["Railway", "Render", "AWS", "GCP", "Heroku", "DigitalOcean", "Other"]
         ).ask()
 
+        self.derive_config()
+
+        return True
+
+    def derive_config(self):
+        """Fill in values derived from the answers; explicit values in a config file win"""
+        slug = self.config['project_slug']
+        self.config.setdefault('backend_language', BACKEND_LANGUAGES.get(self.config['backend_framework'], "Python"))
+
         # URLs (optional)
-        self.config['frontend_prod_url'] = f"https://{self.config['project_slug']}.vercel.app"
-        self.config['frontend_staging_url'] = f"https://{self.config['project_slug']}-staging.vercel.app"
-        self.config['backend_prod_url'] = f"https://{self.config['project_slug']}-production.up.railway.app"
-        self.config['backend_staging_url'] = f"https://{self.config['project_slug']}-staging.up.railway.app"
+        self.config.setdefault('frontend_prod_url', f"https://{slug}.vercel.app")
+        self.config.setdefault('frontend_staging_url', f"https://{slug}-staging.vercel.app")
+        self.config.setdefault('backend_prod_url', f"https://{slug}-production.up.railway.app")
+        self.config.setdefault('backend_staging_url', f"https://{slug}-staging.up.railway.app")
 
         # CI/CD
-        self.config['ci_cd_platform'] = "GitHub Actions"
-        self.config['monitoring_platform'] = "None"
+        self.config.setdefault('ci_cd_platform', "GitHub Actions")
+        self.config.setdefault('monitoring_platform', "None")
 
-        # Timestamps
-        self.config['setup_date'] = datetime.now().isoformat()
-        self.config['current_date'] = datetime.now().strftime("%Y-%m-%d")
+        # Timestamps; re-runs keep the first run's setup_date so rendered outputs stay unchanged
+        setup_date = load_render_state(self.project_root).get('setup_date')
+        self.config.setdefault('setup_date', setup_date or datetime.now().isoformat())
+        self.config.setdefault('current_date', datetime.now().strftime("%Y-%m-%d"))
 
         # Project root
         self.config['project_root'] = str(self.project_root)
 
-        return True
-
     def choose_tier(self) -> bool:
         """Let user choose tier (minimal, standard, complete)"""
         print_header("Choose Your Tier")
 
+        if self.headless:
+            tier = str(self.config.get('tier', 'standard')).lower()
+            if tier not in TIER_FEATURES:
+                print_error(f"Unknown tier '{tier}' (expected one of: {', '.join(TIER_FEATURES)})")
+                return False
+            self.config['tier'] = tier
+            for key, value in TIER_FEATURES[tier].items():
+                self.config.setdefault(key, value)
+            print_success(f"Selected: {tier.upper()} tier")
+            return True
+
         print("📊 Tier Comparison:\n")
         print("1. MINIMAL (30-minute setup)")
         print("   • 5 core agents (Atharva, Anand, Ankur, Debugger, Memory)")
@@ -264,88 +563,93 @@ class SetupWizard:
 
         if "Minimal" in tier:
             self.config['tier'] = "minimal"
-            self.config['enable_structure_enforcement'] = True
-            self.config['enable_memory_system'] = False
-            self.config['enable_reflection_system'] = False
-            self.config['enable_automated_cleanup'] = False
         elif "Standard" in tier:
             self.config['tier'] = "standard"
-            self.config['enable_structure_enforcement'] = True
-            self.config['enable_memory_system'] = True
-            self.config['enable_reflection_system'] = False
-            self.config['enable_automated_cleanup'] = False
         else:  # Complete
             self.config['tier'] = "complete"
-            self.config['enable_structure_enforcement'] = True
-            self.config['enable_memory_system'] = True
-            self.config['enable_reflection_system'] = True
-            self.config['enable_automated_cleanup'] = True
+        self.config.update(TIER_FEATURES[self.config['tier']])
 
         print_success(f"Selected: {self.config['tier'].upper()} tier")
         return True
 
     def copy_template_files(self) -> bool:
-        """Copy template files to project directory"""
-        print_header("Copying Template Files")
-
-        # Copy .claude directory structure
-        for subdir in ['agents', 'docs', 'hooks', 'memory', 'scripts', 'structure', 'config']:
-            src = self.template_root / '.claude' / subdir
-            dst = self.project_root / '.claude' / subdir
-
-            if src.exists():
-                if dst.exists():
-                    print_warning(f"Directory exists: .claude/{subdir} (skipping)")
-                else:
-                    shutil.copytree(src, dst)
-                    print_success(f"Copied .claude/{subdir}")
-
-        # Copy documentation
-        docs_src = self.template_root / 'docs'
-        docs_dst = self.project_root / 'docs'
-        if docs_src.exists() and not docs_dst.exists():
-            shutil.copytree(docs_src, docs_dst)
-            print_success("Copied documentation")
-
-        # Copy tests
-        tests_src = self.template_root / 'tests'
-        tests_dst = self.project_root / 'tests'
-        if tests_src.exists() and not tests_dst.exists():
-            shutil.copytree(tests_src, tests_dst)
-            print_success("Copied validation tests")
+        """Copy template files to project directory (incrementally with --sync)"""
+        print_header("Syncing Template Files" if self.sync else "Copying Template Files")
+
+        # Without --sync, existing directories are left untouched as before
+        dirs = []
+        for rel_dir in TEMPLATE_DIRS:
+            if not (self.template_root / rel_dir).exists():
+                continue
+            if (self.project_root / rel_dir).exists() and not self.sync:
+                print_warning(f"Directory exists: {rel_dir} (skipping, use --sync to update)")
+            else:
+                dirs.append(rel_dir)
+
+        template_sync = TemplateSync(self.template_root, self.project_root)
+        if template_sync.adopting and self.sync:
+            print_warning("No previous sync state: differing files are replaced, previous content kept as *.pre-sync")
+        report = template_sync.run(dirs)
+
+        print_success(f"Copied {len(report['copied'])} files ({format_bytes(report['bytes'])}), "
+                      f"{len(report['unchanged'])} unchanged")
+        for rel in report['modified']:
+            print_warning(f"Kept local changes: {rel}")
+        for rel in report['conflict']:
+            print_warning(f"Conflict (local changes kept, template version in {rel}.template-new): {rel}")
+        for rel in report['adopted']:
+            print_warning(f"Updated to the template version (previous content in {rel}.pre-sync): {rel}")
+        self.sync_report = report
 
         return True
 
     def render_templates(self) -> bool:
-        """Render all Jinja2 templates"""
+        """Render every *.j2 template; outputs whose inputs are unchanged are skipped"""
         print_header("Generating Configuration Files")
 
-        templates = [
-            (self.template_root / 'CLAUDE.md.j2',
-             self.project_root / 'CLAUDE.md'),
-            (self.template_root / 'AGENT_COMMUNICATION_BOARD.md.j2',
-             self.project_root / 'AGENT_COMMUNICATION_BOARD.md'),
-            (self.project_root / '.claude/config/project-config.yaml.j2',
-             self.project_root / '.claude/config/project-config.yaml'),
-            (self.project_root / '.claude/config/reflection-config.json.j2',
-             self.project_root / '.claude/config/reflection-config.json'),
-        ]
-
-        for template_path, output_path in templates:
-            if template_path.exists():
-                with open(template_path, 'r') as f:
-                    template = Template(f.read())
-
-                rendered = template.render(**self.config)
-
-                with open(output_path, 'w') as f:
-                    f.write(rendered)
+        env = template_environment(self.template_root, self.project_root)
+        names = discover_templates(self.template_root)
+        if not names:
+            print_warning("No templates found (*.j2)")
+            return True
 
-                print_success(f"Generated {output_path.name}")
+        state = load_render_state(self.project_root)
+        digests = state['templates']
+
+        def render(name: str) -> tuple:
+            output_path = self.project_root / name[:-len('.j2')]
+            digest = render_digest(env, name, self.config)
+            if digests.get(name) == digest and output_path.exists():
+                return name, digest, False
+            rendered = env.get_template(name).render(**self.config)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w') as f:
+                f.write(rendered)
+            return name, digest, True
+
+        failed = False
+        with ThreadPoolExecutor(max_workers=min(len(names), 8)) as pool:
+            futures = [pool.submit(render, name) for name in names]
+        for name, future in zip(names, futures):
+            try:
+                name, digest, written = future.result()
+            except Exception as e:
+                print_error(f"Failed to render {name}: {e}")
+                digests.pop(name, None)
+                failed = True
+                continue
+            digests[name] = digest
+            output_name = Path(name[:-len('.j2')]).name
+            if written:
+                print_success(f"Generated {output_name}")
             else:
-                print_warning(f"Template not found: {template_path.name}")
+                print_success(f"{output_name} up to date")
 
-        return True
+        state['setup_date'] = self.config.get('setup_date')
+        with open(self.project_root / RENDER_STATE_FILE, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+
+        return not failed
 
     def install_git_hooks(self) -> bool:
         """Install git hooks"""
@@ -420,28 +724,48 @@ class SetupWizard:
 
                 print_success(f"Initialized memory for {agent}")
 
+        # Append-only event logs behind the JSON snapshots; the engine ships with the project
+        engine = self.project_root / AGENT_MEMORY_SCRIPT
+        if not engine.exists():
+            # .claude/scripts already existed and was skipped by the copy step
+            TemplateSync.copy(self.template_root / AGENT_MEMORY_SCRIPT, engine)
+        spec = importlib.util.spec_from_file_location('agent_memory', engine)
+        agent_memory = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(agent_memory)
+        store = agent_memory.MemoryStore(self.project_root / '.claude/memory')
+        for agent in agents:
+            store.agent(agent).create()
+        print_success(f"Event logs ready for {len(agents)} agents (.claude/memory/<agent>/events.jsonl)")
+
         return True
 
     def validate_setup(self) -> bool:
-        """Run validation tests"""
+        """Run validation tests (in-process; results also written to .claude/.cache/validation.json)"""
         print_header("Validating Setup")
 
         validate_script = self.project_root / 'tests/validate_setup.py'
         if validate_script.exists():
             try:
-                result = subprocess.run(
-                    ['python3', str(validate_script)],
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True
-                )
-                print(result.stdout)
-                if result.returncode == 0:
+                spec = importlib.util.spec_from_file_location('validate_setup', validate_script)
+                module = importlib.util.module_from_spec(spec)
+                # Registered so forked workers can unpickle its functions (large memory files);
+                # where only spawn is available it validates them in threads instead
+                sys.modules[spec.name] = module
+                spec.loader.exec_module(module)
+                if not supports_in_process(module):
+                    # A copy from before in-process validation (kept by the copy step): run it as a script
+                    return self.run_validation_script(validate_script)
+                validator = module.SetupValidator(project_root=self.project_root)
+                passed = validator.run_all_checks()
+                report_path = self.project_root / '.claude/.cache/validation.json'
+                report_path.parent.mkdir(parents=True, exist_ok=True)
+                validator.write_json(report_path)
+                self.validation_report = validator.report()
+                if passed:
                     print_success("All validation checks passed!")
-                    return True
                 else:
                     print_warning("Some validation checks failed (see above)")
-                    return True  # Non-fatal
+                return True  # Non-fatal
             except Exception as e:
                 print_warning(f"Validation script failed: {e}")
                 return True  # Non-fatal
@@ -449,6 +773,21 @@ class SetupWizard:
             print_warning("Validation script not found (skipping validation)")
             return True
 
+    def run_validation_script(self, validate_script: Path) -> bool:
+        """Run validate_setup.py in a subprocess (older copies have no in-process API)"""
+        result = subprocess.run(
+            [sys.executable, str(validate_script)],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True
+        )
+        print(result.stdout)
+        if result.returncode == 0:
+            print_success("All validation checks passed!")
+        else:
+            print_warning("Some validation checks failed (see above)")
+        return True  # Non-fatal
+
     def show_success_message(self):
         """Show final success message"""
         print_header("Setup Complete!")
@@ -475,9 +814,139 @@ class SetupWizard:
         print(f"{Colors.YELLOW}⚡ Pro tip:{Colors.END} Check AGENT_COMMUNICATION_BOARD.md to track progress")
         print()
 
+def bootstrap_project(target: str, answers: dict, log_path: str, sync: bool = False) -> dict:
+    """Fleet worker: headless setup of one project with all output going to its log file"""
+    start = time.perf_counter()
+    error = None
+    with open(log_path, 'w') as log, redirect_stdout(log), redirect_stderr(log):
+        try:
+            Path(target).mkdir(parents=True, exist_ok=True)
+            wizard = SetupWizard(sync=sync, project_root=Path(target), answers=answers)
+            if not wizard.run():
+                error = "setup failed (see log)"
+        except Exception as e:
+            traceback.print_exc()
+            error = f"{type(e).__name__}: {e}"
+    return {
+        'project': target,
+        'ok': error is None,
+        'error': error,
+        'seconds': round(time.perf_counter() - start, 3),
+        'log': log_path,
+    }
+
+def run_fleet(targets: List[str], answers: dict, log_dir: Path, workers: Optional[int] = None,
+              sync: bool = False) -> bool:
+    """Bootstrap many projects in parallel from one config file
+
+    Targets come from the command line and from the config's `projects` list, whose
+    entries are a path or a mapping of {path, ...per-project overrides}.
+    """
+    print_header("Fleet Setup")
+
+    base = {k: v for k, v in answers.items() if k != 'projects'}
+    jobs = [(target, {}) for target in targets]
+    for entry in answers.get('projects') or []:
+        if isinstance(entry, dict):
+            jobs.append((entry['path'], {k: v for k, v in entry.items() if k != 'path'}))
+        else:
+            jobs.append((entry, {}))
+    if not jobs:
+        print_error("No target projects (pass directories or list them under `projects` in the config)")
+        return False
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for index, (target, overrides) in enumerate(jobs):
+            target = str(Path(target).expanduser().resolve())
+            log_path = log_dir / f"{index:03d}-{Path(target).name}.log"
+            futures.append(pool.submit(bootstrap_project, target, {**base, **overrides}, str(log_path), sync))
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['ok']:
+                print_success(f"{result['project']} ({result['seconds']:.1f}s)")
+            else:
+                print_error(f"{result['project']}: {result['error']} ({result['seconds']:.1f}s, log: {result['log']})")
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda r: r['project'])
+    failed = [r for r in results if not r['ok']]
+    summary = {
+        'projects': len(results),
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+        'wall_seconds': round(elapsed, 3),
+        'project_seconds': round(sum(r['seconds'] for r in results), 3),
+        'results': results,
+    }
+    with open(log_dir / 'fleet-summary.json', 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    print_header("Fleet Summary")
+    print(f"{Colors.BOLD}Projects:{Colors.END} {summary['projects']} "
+          f"({summary['succeeded']} succeeded, {summary['failed']} failed)")
+    print(f"{Colors.BOLD}Time:{Colors.END} {elapsed:.1f}s wall, {summary['project_seconds']:.1f}s across projects")
+    slowest = max(results, key=lambda r: r['seconds'])
+    print(f"{Colors.BOLD}Slowest:{Colors.END} {slowest['project']} ({slowest['seconds']:.1f}s)")
+    print(f"{Colors.BOLD}Logs:{Colors.END} {log_dir}")
+    return not failed
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Claude Code Project Setup Wizard")
+    parser.add_argument('targets', nargs='*',
+                        help="Project directories to bootstrap (with --fleet)")
+    parser.add_argument('--sync', action='store_true',
+                        help="Update an existing project to this template: copy only changed files, keep local edits")
+    parser.add_argument('--config', type=Path,
+                        help="YAML/JSON file with all setup answers; runs without prompts")
+    parser.add_argument('--fleet', action='store_true',
+                        help="Bootstrap every target (and `projects` in --config) in parallel")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Fleet worker processes (default: CPU count)")
+    parser.add_argument('--log-dir', type=Path, default=Path('setup-logs'),
+                        help="Fleet per-project logs and fleet-summary.json (default: setup-logs)")
+    parser.add_argument('--profile', nargs='?', type=Path, const=Path('setup-profile.json'), default=None,
+                        metavar='REPORT',
+                        help="Time each phase (wall, CPU, bytes written, subprocesses) and write a JSON report "
+                             "(default: setup-profile.json)")
+    parser.add_argument('--cprofile', type=Path, metavar='DIR',
+                        help="With --profile, also dump a cProfile .prof file per phase into DIR")
+    args = parser.parse_args(argv)
+    if args.targets and not args.fleet:
+        parser.error("target directories require --fleet")
+    return args
+
 def main():
-    wizard = SetupWizard()
-    success = wizard.run()
+    args = parse_args()
+    try:
+        answers = load_config_file(args.config) if args.config else None
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print_error(f"Could not read config: {e}")
+        sys.exit(1)
+
+    if args.fleet:
+        success = run_fleet(args.targets, answers or {}, args.log_dir, args.workers, args.sync)
+        sys.exit(0 if success else 1)
+
+    profiler = None
+    if args.profile:
+        from setup_profiler import PhaseProfiler
+        profiler = PhaseProfiler('setup', cprofile_dir=args.cprofile)
+
+    wizard = SetupWizard(sync=args.sync, answers=answers, profiler=profiler)
+    if args.sync and not answers:
+        success = wizard.run_phase('copy_template_files', wizard.copy_template_files)
+    else:
+        success = wizard.run()
+
+    if profiler is not None:
+        report = profiler.write_report(args.profile)
+        profiler.print_summary()
+        print(f"\nSlowest phase: {report['slowest_phase']} — report written to {args.profile}")
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
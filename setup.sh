@@ -82,5 +82,6 @@ echo "=============================================="
 echo "🚀 Quick Start Commands:"
 echo "   Frontend (Next.js):  npm run dev"
 echo "   Backend (FastAPI):   uvicorn main:app --reload"
+echo "   Backend (prod):      python -m backend.serve"
 echo ""
 echo "📚 See README.md for more details."
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Setup Phase Profiler
+Per-phase wall time, CPU time, bytes written and subprocess time for setup.py and init-project.py
+"""
+
+import os
+import sys
+import json
+import time
+import cProfile
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+def io_bytes_written() -> Optional[int]:
+    """Bytes this process has passed to write() so far (Linux /proc only; None elsewhere)"""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+class PhaseProfiler:
+    """Records one entry per phase; use `with profiler.phase(name):` around each step
+
+    Subprocess time is the wall time spent in subprocess.run/call/check_call/check_output
+    while a phase is open; child CPU time comes from os.times() and covers every child
+    process that was waited for.
+    """
+
+    def __init__(self, tool: str, cprofile_dir: Optional[Path] = None):
+        self.tool = tool
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir else None
+        self.phases: List[Dict] = []
+        self.subprocess_seconds = 0.0
+        self.subprocess_calls = 0
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def track_subprocesses(self):
+        """Time the blocking subprocess helpers for the duration of the block"""
+        originals = {name: getattr(subprocess, name) for name in ('run', 'call', 'check_call', 'check_output')}
+
+        def timed(fn):
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.subprocess_seconds += time.perf_counter() - start
+                    self.subprocess_calls += 1
+            return wrapper
+
+        for name, fn in originals.items():
+            setattr(subprocess, name, timed(fn))
+        try:
+            yield
+        finally:
+            for name, fn in originals.items():
+                setattr(subprocess, name, fn)
+
+    @contextmanager
+    def phase(self, name: str):
+        entry = {'phase': name}
+        profile = cProfile.Profile() if self.cprofile_dir else None
+        times = os.times()
+        written = io_bytes_written()
+        subprocess_seconds, subprocess_calls = self.subprocess_seconds, self.subprocess_calls
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            with self.track_subprocesses():
+                yield entry
+        finally:
+            if profile:
+                profile.disable()
+            entry['wall_seconds'] = round(time.perf_counter() - wall, 6)
+            entry['cpu_seconds'] = round(time.process_time() - cpu, 6)
+            end_times = os.times()
+            entry['child_cpu_seconds'] = round(
+                (end_times.children_user - times.children_user)
+                + (end_times.children_system - times.children_system), 6)
+            entry['subprocess_seconds'] = round(self.subprocess_seconds - subprocess_seconds, 6)
+            entry['subprocess_calls'] = self.subprocess_calls - subprocess_calls
+            end_written = io_bytes_written()
+            entry['bytes_written'] = end_written - written if written is not None and end_written is not None else None
+            if profile:
+                self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+                index = len(self.phases) + 1
+                path = self.cprofile_dir / f"{self.tool}-{index:02d}-{name}.prof"
+                profile.dump_stats(str(path))
+                entry['cprofile'] = str(path)
+            self.phases.append(entry)
+
+    def report(self) -> Dict:
+        total_wall = time.perf_counter() - self.started
+        phase_wall = sum(p['wall_seconds'] for p in self.phases)
+        slowest = max(self.phases, key=lambda p: p['wall_seconds'])['phase'] if self.phases else None
+        return {
+            'tool': self.tool,
+            'generated': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'total_wall_seconds': round(total_wall, 6),
+            'phase_wall_seconds': round(phase_wall, 6),
+            'slowest_phase': slowest,
+            'phases': self.phases,
+        }
+
+    def write_report(self, path: Path) -> Dict:
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def print_summary(self):
+        print(f"\n{'Phase':<24}{'Wall':>10}{'CPU':>10}{'Child CPU':>11}{'Subproc':>10}{'Written':>12}")
+        for p in self.phases:
+            written = '-' if p['bytes_written'] is None else f"{p['bytes_written']:,}"
+            print(f"{p['phase']:<24}{p['wall_seconds']:>9.3f}s{p['cpu_seconds']:>9.3f}s"
+                  f"{p['child_cpu_seconds']:>10.3f}s{p['subprocess_seconds']:>9.3f}s{written:>12}")
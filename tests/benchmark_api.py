@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+In-Process API Benchmark
+Drives the ASGI app from main.py directly (no network) across its routes at
+a configurable concurrency, reports throughput, latency percentiles and
+allocations per request, and fails when results regress past a baseline
+
+Usage:
+    python tests/benchmark_api.py --update-baseline    # record this machine's baseline (on main)
+    python tests/benchmark_api.py                      # run and compare; fails without a baseline
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Colors
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+RED = '\033[91m'
+BOLD = '\033[1m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / 'tests' / 'benchmark-baseline.json'
+
+BATCH_BODY = json.dumps([f"user-{i}" for i in range(100)]).encode()
+
+# name -> (method, path, query string, body)
+ROUTES: Dict[str, Tuple[str, str, bytes, bytes]] = {
+    'root': ('GET', '/', b'', b''),
+    'health': ('GET', '/health', b'', b''),
+    'health_live': ('GET', '/health/live', b'', b''),
+    'health_ready': ('GET', '/health/ready', b'', b''),
+    'hello': ('GET', '/api/hello', b'name=bench', b''),
+    'hello_batch': ('POST', '/api/hello/batch', b'', BATCH_BODY),
+    'metrics': ('GET', '/metrics', b'', b''),
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class ASGIDriver:
+    """Issues requests against an ASGI app in-process"""
+
+    def __init__(self, app):
+        self.app = app
+        self.lifespan_task: Optional[asyncio.Task] = None
+        self.lifespan_queue: Optional[asyncio.Queue] = None
+
+    async def startup(self):
+        self.lifespan_queue = asyncio.Queue()
+        started = asyncio.get_running_loop().create_future()
+        await self.lifespan_queue.put({'type': 'lifespan.startup'})
+
+        async def receive():
+            return await self.lifespan_queue.get()
+
+        async def send(message):
+            if message['type'].startswith('lifespan.startup') and not started.done():
+                started.set_result(message['type'])
+
+        scope = {'type': 'lifespan', 'asgi': {'version': '3.0', 'spec_version': '2.0'}, 'state': {}}
+        self.lifespan_task = asyncio.create_task(self.app(scope, receive, send))
+        result = await started
+        if result != 'lifespan.startup.complete':
+            raise RuntimeError(f"App startup failed: {result}")
+
+    async def shutdown(self):
+        if self.lifespan_task is not None:
+            await self.lifespan_queue.put({'type': 'lifespan.shutdown'})
+            await self.lifespan_task
+
+    async def request(self, method: str, path: str, query: bytes = b'', body: bytes = b'') -> int:
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0', 'spec_version': '2.4'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query,
+            'root_path': '',
+            'headers': [
+                (b'host', b'bench'),
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+            ],
+            'client': ('127.0.0.1', 50000),
+            'server': ('bench', 80),
+            'state': {},
+        }
+        pending = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        status = [0]
+
+        async def receive():
+            if pending:
+                return pending.pop()
+            await asyncio.sleep(3600)
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status[0] = message['status']
+
+        await self.app(scope, receive, send)
+        return status[0]
+
+
+class APIBenchmark:
+    def __init__(self, app, concurrency: int, requests: int, warmup: int, alloc_samples: int,
+                 repeat: int = 1):
+        self.driver = ASGIDriver(app)
+        self.repeat = max(1, repeat)
+        self.concurrency = concurrency
+        self.requests = requests
+        self.warmup = warmup
+        self.alloc_samples = alloc_samples
+
+    async def bench_route(self, route: Tuple[str, str, bytes, bytes]) -> Dict[str, float]:
+        method, path, query, body = route
+
+        for _ in range(self.warmup):
+            await self.driver.request(method, path, query, body)
+
+        latencies: List[float] = []
+        errors = [0]
+        remaining = [self.requests]
+
+        async def worker():
+            clock = time.perf_counter
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                start = clock()
+                status = await self.driver.request(method, path, query, body)
+                latencies.append(clock() - start)
+                if status >= 500:
+                    errors[0] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        result = {
+            'requests': len(latencies),
+            'errors': errors[0],
+            'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 4),
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 4),
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 4),
+        }
+        result.update(await self.measure_allocations(route))
+        return result
+
+    async def measure_allocations(self, route: Tuple[str, str, bytes, bytes]) -> Dict[str, float]:
+        """Peak traced allocation and retained bytes per request (tracemalloc)
+
+        tracemalloc.reset_peak() is Python 3.9+; on 3.8 tracing restarts for each
+        sample instead, which still gives the peak but not the retained bytes.
+        """
+        method, path, query, body = route
+        can_reset = hasattr(tracemalloc, 'reset_peak')
+        tracemalloc.start()
+        try:
+            peaks = []
+            baseline, _ = tracemalloc.get_traced_memory()
+            for _ in range(self.alloc_samples):
+                if can_reset:
+                    tracemalloc.reset_peak()
+                else:
+                    tracemalloc.stop()
+                    tracemalloc.start()
+                before, _ = tracemalloc.get_traced_memory()
+                await self.driver.request(method, path, query, body)
+                _, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - before)
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            'alloc_peak_bytes': int(sum(peaks) / len(peaks)) if peaks else 0,
+            'retained_bytes': int((retained - baseline) / max(1, self.alloc_samples)) if can_reset else None,
+        }
+
+    async def run(self, route_names: List[str]) -> Dict[str, Dict[str, float]]:
+        await self.driver.startup()
+        try:
+            results = {}
+            for name in route_names:
+                # Keep the best of N runs to damp scheduler noise
+                runs = [await self.bench_route(ROUTES[name]) for _ in range(self.repeat)]
+                results[name] = max(runs, key=lambda r: r['rps'])
+                r = results[name]
+                print(f"  {name:<14} {r['rps']:>10.1f} req/s   p50 {r['p50_ms']:>7.3f} ms   "
+                      f"p95 {r['p95_ms']:>7.3f} ms   p99 {r['p99_ms']:>7.3f} ms   "
+                      f"{r['alloc_peak_bytes']:>7} B/req")
+            return results
+        finally:
+            await self.driver.shutdown()
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            max_regression: float) -> List[str]:
+    """Return a description of every metric that regressed past the tolerance"""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        if reference.get('rps') and current['rps'] < reference['rps'] * (1 - max_regression):
+            regressions.append(f"{name}: throughput {current['rps']} req/s < baseline {reference['rps']} req/s")
+        if reference.get('p99_ms') and current['p99_ms'] > reference['p99_ms'] * (1 + max_regression):
+            regressions.append(f"{name}: p99 {current['p99_ms']} ms > baseline {reference['p99_ms']} ms")
+        if current['errors']:
+            regressions.append(f"{name}: {current['errors']} server errors")
+    return regressions
+
+
+def load_app(target: str):
+    module_name, _, attr = target.partition(':')
+    sys.path.insert(0, str(PROJECT_ROOT))
+    return getattr(importlib.import_module(module_name), attr or 'app')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process benchmark for the FastAPI app")
+    parser.add_argument('--app', default='main:app', help="ASGI app import string")
+    parser.add_argument('--routes', default=','.join(ROUTES), help="Comma-separated route names")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=5000, help="Requests per route")
+    parser.add_argument('--warmup', type=int, default=200)
+    parser.add_argument('--alloc-samples', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per route; the best is kept")
+    parser.add_argument('--output', default='benchmark-report.json', help="JSON report path")
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+    parser.add_argument('--max-regression', type=float, default=0.20,
+                        help="Allowed fractional drop in throughput / rise in p99")
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    route_names = [name.strip() for name in args.routes.split(',') if name.strip()]
+    unknown = [name for name in route_names if name not in ROUTES]
+    if unknown:
+        parser.error(f"Unknown routes: {', '.join(unknown)} (choose from {', '.join(ROUTES)})")
+
+    print(f"\n{BOLD}Benchmarking {args.app}{END} "
+          f"({args.requests} requests/route, concurrency {args.concurrency})\n")
+    bench = APIBenchmark(load_app(args.app), args.concurrency, args.requests, args.warmup, args.alloc_samples,
+                         args.repeat)
+    results = asyncio.run(bench.run(route_names))
+
+    report = {
+        'app': args.app,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'concurrency': args.concurrency,
+        'requests_per_route': args.requests,
+        'routes': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"\nReport written to {args.output}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"{GREEN}✅ Baseline updated: {baseline_path}{END}\n")
+        sys.exit(0)
+
+    if not baseline_path.exists():
+        # Baselines are per machine, so none is committed: without one there is nothing to gate on
+        print(f"{RED}❌ No baseline at {baseline_path}{END}")
+        print(f"{YELLOW}   Record one on this machine before your change: "
+              f"python tests/benchmark_api.py --update-baseline{END}\n")
+        sys.exit(2)
+
+    regressions = compare(results, json.loads(baseline_path.read_text()), args.max_regression)
+    if regressions:
+        print(f"{RED}❌ Performance regressions:{END}")
+        for regression in regressions:
+            print(f"{RED}   {regression}{END}")
+        print()
+        sys.exit(1)
+
+    print(f"{GREEN}🎉 No regressions beyond {args.max_regression:.0%} of baseline{END}\n")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
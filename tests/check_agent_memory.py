@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Agent Memory Concurrency Check
+Appends from several processes at once to one agent log while compaction
+runs, and fails unless every event is kept exactly once, in sequence order,
+across the hot/warm tiers and the cold segments
+
+Usage:
+    python tests/check_agent_memory.py [--processes 4] [--events 400]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+from pathlib import Path
+
+# Colors
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / '.claude' / 'scripts'))
+
+from agent_memory import WARM_LIMIT, AgentMemory, read_tail  # noqa: E402
+
+# Small enough that compaction runs many times during the check
+COMPACT_BYTES = 20_000
+
+
+def append_events(directory: str, events: int):
+    memory = AgentMemory(Path(directory), 'stress', compact_bytes=COMPACT_BYTES)
+    for i in range(events):
+        memory.append({'summary': f'event {i}'})
+
+
+def check_read_tail(directory: Path) -> bool:
+    """Blocks that start exactly on a line boundary must not lose a line"""
+    path = directory / 'tail.jsonl'
+    path.write_bytes(b'L0\nL1\nL2\n')
+    expected = [b'L0', b'L1', b'L2']
+    return all(read_tail(path, count, block_size) == expected[-count:]
+               for count in (1, 2, 3) for block_size in range(1, 12))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent appends + compaction must not lose events")
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--events', type=int, default=400, help="Events appended per process")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        workers = [multiprocessing.Process(target=append_events, args=(tmp, args.events))
+                   for _ in range(args.processes)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        memory = AgentMemory(directory, 'stress')
+        recent = [event['seq'] for event in reversed(memory.recent(WARM_LIMIT))]
+        seqs = [event['seq'] for event in memory.cold()] + recent
+        total = args.processes * args.events
+        tail_ok = check_read_tail(directory)
+        segments = len(memory.segments())
+
+    print(f"\n  events appended   {total:>8}")
+    print(f"  events kept       {len(seqs):>8}")
+    print(f"  last seq          {seqs[-1] if seqs else 0:>8}")
+    print(f"  cold segments     {segments:>8}\n")
+
+    if seqs != list(range(1, total + 1)):
+        print(f"{RED}❌ Events lost or duplicated under concurrent appends{END}\n")
+        sys.exit(1)
+    if not tail_ok:
+        print(f"{RED}❌ read_tail dropped a line at a block boundary{END}\n")
+        sys.exit(1)
+    print(f"{GREEN}✅ Every event kept exactly once ({segments} cold segments){END}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Board Stream Check
+Subscribes to a BoardWatcher concurrently and fails if more than one poller
+is started or any survives stop(), or if an SSE client is sent a delta that
+its snapshot already contains
+
+Usage:
+    python tests/check_board_stream.py [--subscribers 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Colors
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.board import BoardWatcher, sse_stream  # noqa: E402
+
+BOARD = "## In Progress\n- **[T1]** Build the API – @anand-2.0 (started)\n"
+
+
+def pollers():
+    return [task for task in asyncio.all_tasks()
+            if not task.done() and task.get_coro().__qualname__ == 'BoardWatcher._run']
+
+
+async def check_concurrent_subscribe(path: Path, subscribers: int) -> tuple:
+    watcher = BoardWatcher(str(path), interval=0.05)
+    await asyncio.gather(*(watcher.subscribe() for _ in range(subscribers)))
+    started = len(pollers())
+    await watcher.stop()
+    await asyncio.sleep(0)
+    return started, len(pollers())
+
+
+async def check_snapshot_deltas(path: Path) -> list:
+    """Event ids after the first snapshot: the snapshot's own version must not come again"""
+    watcher = BoardWatcher(str(path), interval=60)
+    queue = await watcher.subscribe()
+    # Published after subscribe() but before the stream sends its snapshot
+    path.write_text(BOARD.replace("(started)", "(in review)"), encoding='utf-8')
+    await watcher.refresh()
+    stream = sse_stream(watcher, queue, heartbeat=60)
+    first = await stream.__anext__()
+    path.write_text(BOARD.replace("(started)", "(done)"), encoding='utf-8')
+    await watcher.refresh()
+    event = await stream.__anext__()
+    await stream.aclose()
+    await watcher.stop()
+    ids = [line for chunk in (first, event) for line in chunk.decode().splitlines() if line.startswith('id: ')]
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Board watcher start/stop and snapshot/delta ordering")
+    parser.add_argument('--subscribers', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'AGENT_COMMUNICATION_BOARD.md'
+        path.write_text(BOARD, encoding='utf-8')
+        started, leftover = asyncio.run(check_concurrent_subscribe(path, args.subscribers))
+        path.write_text(BOARD, encoding='utf-8')
+        ids = asyncio.run(check_snapshot_deltas(path))
+
+    print(f"\n  concurrent subscribers  {args.subscribers:>4}")
+    print(f"  pollers started         {started:>4}")
+    print(f"  pollers after stop()    {leftover:>4}")
+    print(f"  event ids               {' '.join(i[4:] for i in ids)}\n")
+
+    if started != 1 or leftover:
+        print(f"{RED}❌ Concurrent subscribes started {started} pollers, {leftover} left after stop(){END}\n")
+        sys.exit(1)
+    if ids != ['id: 2', 'id: 3']:
+        print(f"{RED}❌ Expected snapshot 2 then delta 3, got {ids}{END}\n")
+        sys.exit(1)
+    print(f"{GREEN}✅ One poller per watcher, stopped cleanly; no delta repeats its snapshot{END}\n")
+
+
+if __name__ == '__main__':
+    main()
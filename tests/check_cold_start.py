@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Budget Check
+Launches fresh interpreters that build main.create_app() and run its
+startup lifespan, and fails when the median time to ready exceeds the
+budget (scale-from-zero adds this to first-request latency)
+
+Usage:
+    python tests/check_cold_start.py [--budget-ms 1500] [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Colors
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when app cold start exceeds a budget")
+    parser.add_argument('--target', default='main:create_app')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.environ.get('COLD_START_BUDGET_MS', 1500)))
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from backend.startup import measure_cold_start
+
+    print("\nMeasuring cold start...\n")
+    result = measure_cold_start(args.target, args.runs, cwd=str(PROJECT_ROOT))
+    run = result['median_run']
+
+    print(f"  interpreter + imports  {run['import_ms']:>9.1f} ms")
+    print(f"  create_app()           {run['create_ms']:>9.1f} ms")
+    print(f"  lifespan startup       {run['lifespan_ms']:>9.1f} ms")
+    for phase, ms in (run.get('report') or {}).get('phases_ms', {}).items():
+        print(f"    {phase:<20} {ms:>9.1f} ms")
+    print(f"  process → ready        {result['median_total_ms']:>9.1f} ms "
+          f"(median of {result['runs']}, ±{result['stdev_total_ms']:.1f})\n")
+
+    if result['median_total_ms'] > args.budget_ms:
+        print(f"{RED}❌ Cold start {result['median_total_ms']:.0f} ms exceeds budget {args.budget_ms:.0f} ms{END}\n")
+        sys.exit(1)
+
+    print(f"{GREEN}✅ Cold start within budget ({args.budget_ms:.0f} ms){END}\n")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Template Render Cache Check
+Runs setup.py's render step twice in a scratch project with the same
+headless answers and fails unless the second run skips every template
+(no output rewritten, setup_date kept from the first run)
+
+Usage:
+    python tests/check_render_cache.py
+"""
+
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Colors
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup import SetupWizard, discover_templates  # noqa: E402
+
+ANSWERS = {'project_name': 'Render Check', 'tier': 'standard'}
+
+
+def render(project_root: Path) -> dict:
+    """mtime_ns of every rendered output after one headless render"""
+    wizard = SetupWizard(project_root=project_root, answers=dict(ANSWERS))
+    with redirect_stdout(io.StringIO()):
+        if not (wizard.gather_project_info() and wizard.choose_tier() and wizard.render_templates()):
+            raise RuntimeError("render step failed")
+    outputs = [project_root / name[:-len('.j2')] for name in discover_templates(PROJECT_ROOT)]
+    return {path.name: path.stat().st_mtime_ns for path in outputs}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        first = render(Path(tmp))
+        second = render(Path(tmp))
+
+    rewritten = sorted(name for name in second if second[name] != first[name])
+    print(f"\n  templates rendered      {len(first):>4}")
+    print(f"  rewritten on re-run     {len(rewritten):>4}\n")
+
+    if not first or rewritten:
+        print(f"{RED}❌ Re-render with the same answers rewrote: {', '.join(rewritten) or 'no templates found'}{END}\n")
+        sys.exit(1)
+    print(f"{GREEN}✅ Re-render with the same answers skipped every template{END}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Route Metrics Label Check
+Sends requests through main.create_app() and fails unless each lands under
+its route template in http_requests_total: cache HITs and 304s (answered
+before routing) included, unknown paths under the shared unmatched label
+
+Usage:
+    python tests/check_route_metrics.py
+"""
+
+import sys
+from pathlib import Path
+
+# Colors
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def main():
+    from fastapi.testclient import TestClient
+    from backend.metrics import UNMATCHED_ROUTE
+    from main import create_app
+
+    app = create_app()
+    with TestClient(app) as client:
+        etag = client.get('/').headers['etag']
+        cache_statuses = [client.get('/').headers.get('x-cache') for _ in range(3)]
+        not_modified = client.get('/', headers={'If-None-Match': etag}).status_code
+        client.get('/api/hello', params={'name': 'Metrics'})
+        client.get('/api/hello', params={'name': 'Metrics'})
+        client.get('/no/such/path')
+
+    routes = {key: stats.statuses for key, stats in app.state.metrics.routes.items()}
+    expected = {
+        ('GET', '/'): {200: 4, 304: 1},
+        ('GET', '/api/hello'): {200: 2},
+        ('GET', UNMATCHED_ROUTE): {404: 1},
+    }
+
+    print()
+    for (method, route), statuses in sorted(routes.items()):
+        print(f"  {method:<6} {route:<20} {statuses}")
+    print()
+
+    if cache_statuses != ['HIT'] * 3 or not_modified != 304:
+        print(f"{RED}❌ Expected cache HITs and a 304 for / (got {cache_statuses}, {not_modified}){END}\n")
+        sys.exit(1)
+    wrong = {key: routes.get(key) for key, statuses in expected.items() if routes.get(key) != statuses}
+    if wrong:
+        print(f"{RED}❌ Requests counted under the wrong route label: {wrong}{END}\n")
+        sys.exit(1)
+    print(f"{GREEN}✅ Cache HITs, 304s and misses are labelled with their route template{END}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,26 +7,384 @@ Validates that the project was set up correctly
 import os
 import sys
 import json
-import subprocess
+import time
+import argparse
+import importlib.machinery
+import multiprocessing
+import re
+import errno
+import select
+import struct
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Colors
 GREEN = '\033[92m'
 RED = '\033[91m'
 END = '\033[0m'
 
+FRONTMATTER_DELIMITER = '---'
+
+def read_frontmatter(path: Path) -> dict:
+    """Parse the YAML frontmatter of a Markdown file, reading only up to the closing delimiter"""
+    import yaml
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip('\r\n') != FRONTMATTER_DELIMITER:
+            raise ValueError("missing frontmatter")
+        lines = []
+        for line in f:
+            if line.rstrip('\r\n') == FRONTMATTER_DELIMITER:
+                break
+            lines.append(line)
+        else:
+            raise ValueError("invalid frontmatter format (no closing ---)")
+
+    try:
+        data = yaml.safe_load(''.join(lines))
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid frontmatter YAML: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("invalid frontmatter format (expected key: value pairs)")
+    return data
+
+class FrontmatterCache:
+    """Parsed frontmatter (or the parse error) per file, kept on disk and keyed by path, size and mtime
+
+    Unchanged files cost one stat() on later runs.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.dirty = False
+        try:
+            with open(cache_path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, path: Path) -> dict:
+        """Frontmatter of path; raises ValueError (cached too) if it is missing or invalid"""
+        st = path.stat()
+        key = str(path.resolve())
+        entry = self.entries.get(key)
+        if entry is None or entry['size'] != st.st_size or entry['mtime_ns'] != st.st_mtime_ns:
+            entry = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+            try:
+                # Round-trip through JSON so cached and fresh results compare the same (e.g. dates)
+                entry['frontmatter'] = json.loads(json.dumps(read_frontmatter(path), default=str))
+            except ValueError as e:
+                entry['error'] = str(e)
+            self.entries[key] = entry
+            self.dirty = True
+        if 'error' in entry:
+            raise ValueError(entry['error'])
+        return entry['frontmatter']
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+# Agent memory files: the subset of JSON Schema used here is type/required/properties, plus
+# `tier` marking the hot/warm/cold sections whose entries are counted
+MEMORY_SCHEMA = {
+    'type': 'object',
+    'required': ['agent_name', 'hot_memory', 'warm_memory', 'cold_memory'],
+    'properties': {
+        'agent_name': {'type': 'string'},
+        'last_updated': {'type': 'string'},
+        'hot_memory': {'type': ['object', 'array'], 'tier': 'hot'},
+        'warm_memory': {'type': ['object', 'array'], 'tier': 'warm'},
+        'cold_memory': {'type': ['object', 'array'], 'tier': 'cold'},
+    },
+}
+
+# Above this total size, memory files are validated in worker processes instead of threads
+MEMORY_PROCESS_THRESHOLD = 8 * 1024 * 1024
+
+class CompiledSchema:
+    """MEMORY_SCHEMA flattened into lookups for the streaming scanner (built once per process)"""
+
+    def __init__(self, schema: Dict):
+        self.root_type = schema['type']
+        self.required = tuple(schema.get('required', []))
+        self.types = {}
+        self.tiers = {}
+        for key, spec in schema.get('properties', {}).items():
+            types = spec.get('type')
+            self.types[key] = frozenset([types] if isinstance(types, str) else types or [])
+            if 'tier' in spec:
+                self.tiers[key] = spec['tier']
+
+MEMORY_VALIDATOR = CompiledSchema(MEMORY_SCHEMA)
+
+JSON_TOKEN = re.compile(r"""[ \t\n\r]*(?:
+    (?P<string>"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*")
+  | (?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+  | (?P<literal>true|false|null)
+  | (?P<punct>[{}\[\],:])
+)""", re.VERBOSE)
+
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Content of a string (no quotes); a string cut off at a chunk boundary resumes from here.
+# Written as runs between escapes so the regex engine keeps no per-character state.
+JSON_STRING_BODY = re.compile(r'[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*')
+JSON_PARTIAL_ESCAPE = re.compile(r'\\(?:u[0-9a-fA-F]{0,3})?\Z')
+
+# A number or literal cut off at a chunk boundary (anything else there is invalid)
+JSON_PARTIAL_TOKEN = re.compile(
+    r'(?:-?(?:0|[1-9][0-9]*)?(?:\.[0-9]*)?(?:[eE][+-]?[0-9]*)?|t(?:ru?)?|f(?:a(?:ls?)?)?|n(?:ul?)?)\Z')
+
+def reject_constant(name: str):
+    raise ValueError(f"invalid JSON constant {name}")
+
+# Decodes whole tier entries at C speed; NaN/Infinity are not JSON
+JSON_ENTRY = json.JSONDecoder(parse_constant=reject_constant)
+
+class MemoryFileScanner:
+    """Streaming JSON validation of one memory file in bounded memory
+
+    Checks the file is well-formed JSON and matches the compiled schema, and counts
+    the entries of each tier: the elements of a tier that is an array, or of the
+    arrays directly inside a tier that is an object (keys starting with "_" are
+    template notes and are skipped). Only top-level keys and agent_name are decoded.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    # Longest string kept for decoding (keys, agent_name); longer strings are only validated
+    MAX_DECODED = 64 * 1024
+    # Longest number or literal carried over a chunk boundary
+    MAX_PENDING = 4096
+
+    def __init__(self, schema: CompiledSchema = MEMORY_VALIDATOR):
+        self.schema = schema
+        self.types: Dict[str, str] = {}
+        self.counts = {tier: 0 for tier in schema.tiers.values()}
+        self.agent_name = None
+        # Stack frames: [kind, state, key, tier, counted_tier]
+        self.stack: List[list] = []
+        self.done = False
+        # [offset, pieces or None once over MAX_DECODED, length] while a string spans chunks
+        self.string: Optional[list] = None
+
+    def scan(self, path: Path) -> Dict:
+        offset = 0
+        buffer = ''
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                eof = not chunk
+                buffer += chunk
+                pos = self.resume_string(buffer, 0, eof, offset) if self.string else 0
+                while pos < len(buffer) and self.string is None:
+                    frame = self.stack[-1] if self.stack else None
+                    if frame is not None and frame[4] and frame[0] == 'array' and frame[1] in ('first', 'value'):
+                        # Entry of a counted array: decode it whole when it ends inside the buffer
+                        start = JSON_WHITESPACE.match(buffer, pos).end()
+                        try:
+                            end = JSON_ENTRY.raw_decode(buffer, start)[1]
+                        except ValueError:
+                            end = None  # cut off by the chunk boundary, or invalid: tokenize it instead
+                        # Same margin as numbers below: "1." + "5" must not decode as 1
+                        if end is not None and (len(buffer) - end > 2 or eof):
+                            self.counts[frame[4]] += 1
+                            self.end_value()
+                            pos = end
+                            continue
+                    match = JSON_TOKEN.match(buffer, pos)
+                    if match is None:
+                        pos = JSON_WHITESPACE.match(buffer, pos).end()
+                        if pos < len(buffer) and buffer[pos] == '"':
+                            self.string = [offset + pos, [], 0]
+                            pos = self.resume_string(buffer, pos + 1, eof, offset)
+                            continue
+                        if pos < len(buffer) and (eof or not JSON_PARTIAL_TOKEN.match(buffer, pos)):
+                            raise ValueError(f"invalid JSON at offset {offset + pos}")
+                        break  # number or literal cut off by the chunk boundary
+                    if match.lastgroup == 'number' and len(buffer) - match.end() <= 2 and not eof:
+                        # the number may continue ("1" + "2", "1." + "5", "1e+" + "3")
+                        pos = JSON_WHITESPACE.match(buffer, pos).end()
+                        break
+                    self.token(match.lastgroup, match.group(match.lastgroup), offset + match.start())
+                    pos = match.end()
+                offset += pos
+                buffer = buffer[pos:]
+                if len(buffer) > self.MAX_PENDING:
+                    raise ValueError(f"token too long at offset {offset}")
+                if eof:
+                    break
+        if not self.done or self.string:
+            raise ValueError("truncated JSON")
+        self.check_schema()
+        return {'agent_name': self.agent_name, **self.counts}
+
+    def resume_string(self, buffer: str, pos: int, eof: bool, offset: int) -> int:
+        """Consume string content from pos (each character is scanned once, however many
+        chunks the string spans); emits the token at the closing quote"""
+        end = JSON_STRING_BODY.match(buffer, pos).end()
+        closed = end < len(buffer) and buffer[end] == '"'
+        if not closed and end < len(buffer) and (eof or not JSON_PARTIAL_ESCAPE.match(buffer, end)):
+            raise ValueError(f"invalid JSON string at offset {offset + end}")
+        start, pieces, length = self.string
+        length += end - pos
+        if pieces is not None and length <= self.MAX_DECODED:
+            pieces.append(buffer[pos:end])
+        else:
+            pieces = None
+        if not closed:
+            self.string = [start, pieces, length]
+            return end  # a partial escape stays in the buffer
+        self.string = None
+        self.token('string', None if pieces is None else '"' + ''.join(pieces) + '"', start)
+        return end + 1
+
+    def token(self, kind: str, text: Optional[str], offset: int):
+        """One token; text is None for a string longer than MAX_DECODED"""
+        if self.done:
+            raise ValueError(f"unexpected data after JSON document at offset {offset}")
+        frame = self.stack[-1] if self.stack else None
+        state = frame[1] if frame else 'value'
+        expecting_value = state == 'value' or (state == 'first' and frame[0] == 'array')
+
+        if kind == 'punct':
+            if text in '{[':
+                if not expecting_value:
+                    raise ValueError(f"unexpected '{text}' at offset {offset}")
+                self.begin_value('object' if text == '{' else 'array', frame)
+            elif text in '}]':
+                closes = 'object' if text == '}' else 'array'
+                if frame is None or frame[0] != closes or state not in ('first', 'next'):
+                    raise ValueError(f"unexpected '{text}' at offset {offset}")
+                self.stack.pop()
+                self.end_value()
+            elif text == ':':
+                if state != 'colon':
+                    raise ValueError(f"unexpected ':' at offset {offset}")
+                frame[1] = 'value'
+            else:  # ','
+                if state != 'next':
+                    raise ValueError(f"unexpected ',' at offset {offset}")
+                frame[1] = 'key' if frame[0] == 'object' else 'value'
+            return
+
+        if frame is not None and frame[0] == 'object' and state in ('first', 'key'):
+            if kind != 'string':
+                raise ValueError(f"expected an object key at offset {offset}")
+            if text is None:
+                raise ValueError(f"object key longer than {self.MAX_DECODED} characters at offset {offset}")
+            frame[2] = json.loads(text)
+            frame[1] = 'colon'
+            return
+        if not expecting_value:
+            raise ValueError(f"unexpected value at offset {offset}")
+
+        value_kind = {'string': 'string', 'number': 'number'}.get(kind)
+        if value_kind is None:
+            value_kind = 'null' if text == 'null' else 'boolean'
+        self.begin_value(value_kind, frame)
+        if frame is self.root and frame[2] == 'agent_name' and value_kind == 'string':
+            if text is None:
+                raise ValueError(f"agent_name longer than {self.MAX_DECODED} characters")
+            self.agent_name = json.loads(text)
+        self.end_value()
+
+    @property
+    def root(self):
+        return self.stack[0] if self.stack else None
+
+    def begin_value(self, kind: str, parent: Optional[list]):
+        tier = counted = None
+        if parent is None:
+            if kind != self.schema.root_type:
+                raise ValueError(f"expected a JSON {self.schema.root_type}, found {kind}")
+        else:
+            if parent[4]:
+                self.counts[parent[4]] += 1
+            if parent is self.root:
+                self.types[parent[2]] = kind
+                tier = self.schema.tiers.get(parent[2])
+                if kind == 'array':
+                    counted = tier
+            elif parent[0] == 'object' and parent[3] and kind == 'array' and not parent[2].startswith('_'):
+                counted = parent[3]
+        if kind in ('object', 'array'):
+            self.stack.append([kind, 'first', None, tier if kind == 'object' else None, counted])
+
+    def end_value(self):
+        if self.stack:
+            self.stack[-1][1] = 'next'
+        else:
+            self.done = True
+
+    def check_schema(self):
+        for key in self.schema.required:
+            if key not in self.types:
+                raise ValueError(f"missing key: {key}")
+        for key, kind in self.types.items():
+            allowed = self.schema.types.get(key)
+            if allowed and kind not in allowed:
+                raise ValueError(f"{key} must be {' or '.join(sorted(allowed))}, not {kind}")
+
+def validate_memory_file(path: str) -> Dict:
+    """Per-file report: size, agent name, hot/warm/cold entry counts, and the error if invalid"""
+    start = time.perf_counter()
+    report = {'file': Path(path).name, 'bytes': os.path.getsize(path), 'valid': True, 'error': None}
+    try:
+        report.update(MemoryFileScanner().scan(Path(path)))
+    except (ValueError, UnicodeDecodeError) as e:
+        report.update({'valid': False, 'error': str(e)})
+    report['seconds'] = round(time.perf_counter() - start, 6)
+    return report
+
+def validate_memory_files(paths: List[Path], workers: Optional[int] = None) -> List[Dict]:
+    """Validate files in parallel (worker processes once the total size makes parsing CPU-bound)"""
+    if not paths:
+        return []
+    total = sum(path.stat().st_size for path in paths)
+    max_workers = workers or min(len(paths), os.cpu_count() or 1)
+    context = worker_context() if total > MEMORY_PROCESS_THRESHOLD and len(paths) > 1 else None
+    if context is not None:
+        pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    with pool:
+        return list(pool.map(validate_memory_file, [str(path) for path in paths]))
+
+def worker_context():
+    """Process start method whose workers can load validate_memory_file, or None to use threads
+
+    Forked workers inherit this module however it was loaded (setup.py loads it by path).
+    Spawned workers (macOS, Windows) re-import it by name, which only works when it is
+    the main script or importable from sys.path.
+    """
+    if sys.platform != 'darwin' and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    if __name__ == '__main__' or importlib.machinery.PathFinder.find_spec(__name__, sys.path) is not None:
+        return multiprocessing.get_context('spawn')
+    return None
+
 class SetupValidator:
-    def __init__(self):
-        self.project_root = Path.cwd()
+    def __init__(self, project_root: Optional[Path] = None, workers: Optional[int] = None):
+        self.project_root = Path(project_root or Path.cwd())
+        self.workers = workers
         self.checks_passed = 0
         self.checks_failed = 0
+        self.results: List[Dict] = []
+        self.memory_report: List[Dict] = []
+        self.wall_seconds = 0.0
 
-    def run_all_checks(self) -> bool:
-        """Run all validation checks"""
-        print("\nRunning setup validation...\n")
-
-        checks = [
+    def checks(self) -> List[Tuple[str, callable]]:
+        return [
             ("Git hooks installed", self.check_git_hooks),
             ("Structure validator operational", self.check_structure_validator),
             ("Agent frontmatter valid", self.check_agent_frontmatter),
@@ -36,14 +394,45 @@ class SetupValidator:
             ("Configuration files valid", self.check_config_files),
         ]
 
-        for name, check_fn in checks:
-            try:
-                check_fn()
-                self.check_passed(name)
-            except Exception as e:
-                self.check_failed(name, str(e))
+    def run_check(self, name: str, check_fn) -> Dict:
+        """Run one check; never raises"""
+        start = time.perf_counter()
+        error = None
+        try:
+            check_fn()
+        except Exception as e:
+            error = str(e)
+        return {'name': name, 'passed': error is None, 'error': error,
+                'seconds': round(time.perf_counter() - start, 6)}
+
+    def run_checks(self, checks: List[Tuple[str, callable]]) -> List[Dict]:
+        """Run the given checks concurrently; results in the order given"""
+        if not checks:
+            return []
+        with ThreadPoolExecutor(max_workers=self.workers or len(checks)) as pool:
+            return list(pool.map(lambda check: self.run_check(*check), checks))
 
-        print()
+    def run_all_checks(self) -> bool:
+        """Run all validation checks concurrently; results print in declaration order"""
+        print("\nRunning setup validation...\n")
+
+        start = time.perf_counter()
+        self.results = self.run_checks(self.checks())
+        self.wall_seconds = time.perf_counter() - start
+
+        for result in self.results:
+            if result['passed']:
+                self.check_passed(result['name'], result['seconds'])
+            else:
+                self.check_failed(result['name'], result['error'], result['seconds'])
+
+        if self.memory_report:
+            print(f"\n{'Memory file':<40}{'Size':>12}{'Hot':>7}{'Warm':>7}{'Cold':>7}")
+            for r in self.memory_report:
+                counts = ('-', '-', '-') if not r['valid'] else (r['hot'], r['warm'], r['cold'])
+                print(f"{r['file']:<40}{r['bytes']:>12,}{counts[0]:>7}{counts[1]:>7}{counts[2]:>7}")
+
+        print(f"\n{len(self.results)} checks in {self.wall_seconds * 1000:.1f} ms")
         if self.checks_failed == 0:
             print(f"{GREEN}🎉 All checks passed! Setup complete.{END}\n")
             return True
@@ -51,16 +440,53 @@ class SetupValidator:
             print(f"{RED}⚠️  {self.checks_failed} checks failed.{END}\n")
             return False
 
-    def check_passed(self, name: str):
+    def check_passed(self, name: str, seconds: float = 0.0):
         """Mark check as passed"""
-        print(f"{GREEN}✅ {name}{END}")
+        print(f"{GREEN}✅ {name}{END} ({seconds * 1000:.1f} ms)")
         self.checks_passed += 1
 
-    def check_failed(self, name: str, error: str):
+    def check_failed(self, name: str, error: str, seconds: float = 0.0):
         """Mark check as failed"""
-        print(f"{RED}❌ {name}: {error}{END}")
+        print(f"{RED}❌ {name}: {error}{END} ({seconds * 1000:.1f} ms)")
         self.checks_failed += 1
 
+    def report(self) -> Dict:
+        """Machine-readable results of the last run"""
+        return {
+            'project_root': str(self.project_root),
+            'timestamp': datetime.now().isoformat(),
+            'passed': self.checks_passed,
+            'failed': self.checks_failed,
+            'wall_seconds': round(self.wall_seconds, 6),
+            'checks': self.results,
+            'memory_files': self.memory_report,
+        }
+
+    def write_json(self, path: Path):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def write_junit(self, path: Path):
+        """JUnit XML: one testsuite, one testcase per check"""
+        suite = ET.Element('testsuite', {
+            'name': 'setup-validation',
+            'tests': str(len(self.results)),
+            'failures': str(self.checks_failed),
+            'errors': '0',
+            'time': f"{self.wall_seconds:.6f}",
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        })
+        for result in self.results:
+            case = ET.SubElement(suite, 'testcase', {
+                'classname': 'SetupValidator',
+                'name': result['name'],
+                'time': f"{result['seconds']:.6f}",
+            })
+            if not result['passed']:
+                failure = ET.SubElement(case, 'failure', {'message': result['error']})
+                failure.text = result['error']
+        ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
     def check_git_hooks(self):
         """Verify git hooks are installed"""
         hooks_dir = self.project_root / '.git' / 'hooks'
@@ -82,12 +508,10 @@ class SetupValidator:
         if not validator.exists():
             raise Exception("structure_validator.py not found")
 
-        # Try to import it (basic syntax check)
-        result = subprocess.run(
-            ['python3', '-m', 'py_compile', str(validator)],
-            capture_output=True
-        )
-        if result.returncode != 0:
+        # Basic syntax check (in-process; nothing is written)
+        try:
+            compile(validator.read_bytes(), str(validator), 'exec')
+        except (SyntaxError, ValueError):
             raise Exception("structure_validator.py has syntax errors")
 
     def check_agent_frontmatter(self):
@@ -102,24 +526,21 @@ class SetupValidator:
 
         required_fields = ['agent_name', 'permissionMode']
 
-        for agent_file in agent_files:
-            content = agent_file.read_text()
-
-            if not content.startswith('---'):
-                raise Exception(f"{agent_file.name} missing frontmatter")
-
-            # Extract frontmatter
-            parts = content.split('---')
-            if len(parts) < 3:
-                raise Exception(f"{agent_file.name} invalid frontmatter format")
-
-            frontmatter = parts[1]
-
-            for field in required_fields:
-                if f'{field}:' not in frontmatter:
-                    raise Exception(
-                        f"{agent_file.name} missing required field: {field}"
-                    )
+        cache = FrontmatterCache(self.project_root / '.claude/.cache/frontmatter.json')
+        try:
+            for agent_file in sorted(agent_files):
+                try:
+                    frontmatter = cache.get(agent_file)
+                except ValueError as e:
+                    raise Exception(f"{agent_file.name} {e}")
+
+                for field in required_fields:
+                    if field not in frontmatter:
+                        raise Exception(
+                            f"{agent_file.name} missing required field: {field}"
+                        )
+        finally:
+            cache.save()
 
     def check_memory_files(self):
         """Verify memory files were created"""
@@ -127,19 +548,16 @@ class SetupValidator:
         if not memory_dir.exists():
             raise Exception("Memory directory not found")
 
-        memory_files = list(memory_dir.glob('*-memory.json'))
+        memory_files = sorted(memory_dir.glob('*-memory.json'))
         if len(memory_files) < 5:
             raise Exception(f"Only {len(memory_files)} memory files found (expected at least 5)")
 
-        # Validate JSON structure
-        for memory_file in memory_files[:3]:  # Check first 3
-            with open(memory_file, 'r') as f:
-                data = json.load(f)
-
-            required_keys = ['agent_name', 'hot_memory', 'warm_memory', 'cold_memory']
-            for key in required_keys:
-                if key not in data:
-                    raise Exception(f"{memory_file.name} missing key: {key}")
+        # Every file, streamed against MEMORY_SCHEMA
+        self.memory_report = validate_memory_files(memory_files)
+        invalid = [r for r in self.memory_report if not r['valid']]
+        if invalid:
+            details = '; '.join(f"{r['file']}: {r['error']}" for r in invalid[:3])
+            raise Exception(f"{len(invalid)} of {len(memory_files)} memory files invalid ({details})")
 
     def check_claude_md(self):
         """Verify CLAUDE.md exists and is configured"""
@@ -196,9 +614,229 @@ class SetupValidator:
             if 'tier1_agents' not in data or 'tier2_validator' not in data:
                 raise Exception("reflection-config.json invalid structure")
 
+# Paths (relative to the project root) each check reads; a change at, under or above
+# one of them re-runs the check in --watch mode
+CHECK_DEPENDENCIES = {
+    "Git hooks installed": ['.git/hooks'],
+    "Structure validator operational": ['.claude/scripts/structure_validator.py'],
+    "Agent frontmatter valid": ['.claude/agents'],
+    "Memory system initialized": ['.claude/memory'],
+    "CLAUDE.md configured": ['CLAUDE.md'],
+    "Scripts executable": ['.claude/scripts'],
+    "Configuration files valid": ['.claude/config'],
+}
+
+# Written by the checks themselves; never a reason to re-run them
+WATCH_IGNORE = ('.claude/.cache',)
+
+def watched(rel: str) -> bool:
+    if any(rel == ignored or rel.startswith(ignored + '/') for ignored in WATCH_IGNORE):
+        return False
+    return any(rel == dep or rel.startswith(dep + '/') or dep.startswith(rel + '/')
+               for deps in CHECK_DEPENDENCIES.values() for dep in deps)
+
+def affected_checks(changed) -> List[str]:
+    """Names of the checks depending on any changed path, in declaration order"""
+    return [name for name, deps in CHECK_DEPENDENCIES.items()
+            if any(rel == dep or rel.startswith(dep + '/') or dep.startswith(rel + '/')
+                   for rel in changed for dep in deps)]
+
+def watch_dirs(root: Path) -> List[Path]:
+    """Directories to subscribe to: the root, every ancestor of a dependency and everything under it"""
+    dirs = {root}
+    for deps in CHECK_DEPENDENCIES.values():
+        for dep in deps:
+            path = root
+            for part in Path(dep).parts:
+                if path.is_dir():
+                    dirs.add(path)
+                path = path / part
+            if path.is_dir():
+                for dirpath, dirnames, _ in os.walk(path):
+                    dirnames[:] = [d for d in dirnames
+                                   if watched(Path(dirpath, d).relative_to(root).as_posix())]
+                    dirs.add(Path(dirpath))
+    return sorted(dirs)
+
+class InotifyWatcher:
+    """Linux inotify through libc (no extra dependency); raises OSError where unavailable"""
+
+    IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE = 0x2, 0x4, 0x8
+    IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x40, 0x80, 0x100, 0x200
+    IN_DELETE_SELF, IN_MOVE_SELF, IN_Q_OVERFLOW, IN_IGNORED, IN_ISDIR = 0x400, 0x800, 0x4000, 0x8000, 0x40000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, root: Path):
+        import ctypes
+        import ctypes.util
+
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOSYS, "inotify is Linux-only")
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self.watches: Dict[int, Path] = {}
+        for path in watch_dirs(root):
+            self.add(path)
+
+    def add(self, path: Path):
+        if path in self.watches.values():
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self.watches[wd] = path
+
+    def changes(self, timeout: Optional[float]) -> set:
+        """Relative paths changed within timeout (None blocks until something changes)"""
+        changed = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b'\0')
+            offset += self.EVENT.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add('.')  # events were lost: re-run everything
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            rel = path.relative_to(self.root).as_posix()
+            if rel != '.' and not watched(rel):
+                continue
+            changed.add(rel)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                for new_dir in watch_dirs(self.root):
+                    self.add(new_dir)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback: compares (mtime, size, mode) of every watched path each interval"""
+
+    def __init__(self, root: Path, interval: float = 0.25):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> Dict[str, tuple]:
+        state = {}
+        for directory in watch_dirs(self.root):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = Path(entry.path).relative_to(self.root).as_posix()
+                if watched(rel):
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        # A directory's mtime changes with every file in it; those are tracked themselves
+                        state[rel] = (None, None, st.st_mode)
+                    else:
+                        state[rel] = (st.st_mtime_ns, st.st_size, st.st_mode)
+        return state
+
+    def changes(self, timeout: Optional[float]) -> set:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(wait)
+            current = self.scan()
+            changed = {rel for rel in current.keys() | self.snapshot.keys()
+                       if current.get(rel) != self.snapshot.get(rel)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+def watch(validator: 'SetupValidator', debounce: float = 0.1, poll: bool = False):
+    """Re-run only the checks affected by each burst of changes until interrupted"""
+    validator.run_all_checks()
+    if poll:
+        watcher = PollingWatcher(validator.project_root)
+    else:
+        try:
+            watcher = InotifyWatcher(validator.project_root)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}); polling instead")
+            watcher = PollingWatcher(validator.project_root)
+    print(f"Watching for changes ({type(watcher).__name__}, Ctrl+C to stop)...")
+
+    checks = dict(validator.checks())
+    try:
+        while True:
+            changed = watcher.changes(None)
+            # Debounce: wait for a quiet period so one save (or git checkout) runs the checks once
+            while True:
+                more = watcher.changes(debounce)
+                if not more:
+                    break
+                changed |= more
+            names = list(checks) if '.' in changed else affected_checks(changed)
+            if not names:
+                continue
+            start = time.perf_counter()
+            results = validator.run_checks([(name, checks[name]) for name in names])
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"\n[{datetime.now():%H:%M:%S}] {', '.join(sorted(changed))}")
+            for result in results:
+                if result['passed']:
+                    print(f"{GREEN}✅ {result['name']}{END} ({result['seconds'] * 1000:.1f} ms)")
+                else:
+                    print(f"{RED}❌ {result['name']}: {result['error']}{END} ({result['seconds'] * 1000:.1f} ms)")
+            print(f"{len(results)} of {len(checks)} checks re-run in {elapsed:.1f} ms")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate the project setup")
+    parser.add_argument('--json', type=Path, metavar='PATH', help="Write results as JSON")
+    parser.add_argument('--junit', type=Path, metavar='PATH', help="Write results as JUnit XML")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Checks run concurrently (default: all at once)")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running; re-run the checks affected by changes under .claude/, .git/hooks and CLAUDE.md")
+    parser.add_argument('--poll', action='store_true',
+                        help="With --watch, poll instead of using inotify")
+    parser.add_argument('--debounce', type=float, default=100, metavar='MS',
+                        help="With --watch, quiet period before re-running (default: 100 ms)")
+    return parser.parse_args(argv)
+
 def main():
-    validator = SetupValidator()
+    args = parse_args()
+    validator = SetupValidator(workers=args.workers)
+    if args.watch:
+        watch(validator, debounce=args.debounce / 1000, poll=args.poll)
+        return
+
     success = validator.run_all_checks()
+    if args.json:
+        validator.write_json(args.json)
+    if args.junit:
+        validator.write_junit(args.junit)
 
     if success:
         print("Next steps:")